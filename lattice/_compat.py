@@ -0,0 +1,7 @@
+"""Python version compatibility helpers shared across Lattice modules."""
+
+import sys
+
+# Keyword arguments for @dataclass(**SLOTS). dataclass(slots=True) needs
+# Python 3.10+; on older versions instances keep a __dict__.
+SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -0,0 +1,83 @@
+"""JSON encoding shared by the SQLite backend, UI protocol and Temporal converter.
+
+orjson is used when installed. It writes NaN and infinity as null, so values
+holding them are encoded with stdlib json instead, which writes NaN and
+Infinity and reads them back.
+"""
+
+import dataclasses
+import json
+import math
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+
+def has_non_finite(value: Any) -> bool:
+    """True if value holds a NaN or infinite float at any depth.
+
+    Looks inside dicts, lists, tuples, dataclass fields and numpy float
+    scalars and arrays.
+    """
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(has_non_finite(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(has_non_finite(v) for v in value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return any(
+            has_non_finite(getattr(value, f.name)) for f in dataclasses.fields(value)
+        )
+    dtype = getattr(value, "dtype", None)
+    if dtype is not None and dtype.kind == "f":
+        return has_non_finite(value.tolist())
+    return False
+
+
+def orjson_dumps(value: Any) -> Optional[bytes]:
+    """Encode value with orjson.
+
+    Returns:
+        The JSON bytes, or None if orjson is not installed or cannot encode
+        value faithfully (non-finite floats, integers beyond 64 bits, ...)
+    """
+    if not HAS_ORJSON or has_non_finite(value):
+        return None
+    try:
+        return orjson.dumps(
+            value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    except TypeError:
+        return None
+
+
+def _default(obj: Any) -> Any:
+    """Convert numpy scalars and arrays for stdlib json."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(value: Any) -> Union[bytes, str]:
+    """Encode value as JSON: bytes from orjson, else str from stdlib json."""
+    encoded = orjson_dumps(value)
+    if encoded is not None:
+        return encoded
+    return json.dumps(value, default=_default)
+
+
+def loads(raw: Union[str, bytes]) -> Any:
+    """Decode JSON text or bytes, including NaN and Infinity from stdlib json."""
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN written by stdlib json
+    return json.loads(raw)
@@ -0,0 +1,29 @@
+"""Fast deep copy for JSON-shaped data."""
+
+import copy
+from typing import Any
+
+_ATOMIC = (str, int, float, bool, type(None))
+
+
+def fast_clone(value: Any) -> Any:
+    """Deep-copy a value made of dicts, lists and primitives.
+
+    Serialized object data only contains these types, so a direct
+    recursive copy avoids copy.deepcopy's memo and reduce machinery.
+    Any other type falls back to copy.deepcopy.
+
+    Args:
+        value: The value to copy
+
+    Returns:
+        An independent copy of value
+    """
+    cls = type(value)
+    if cls is dict:
+        return {k: fast_clone(v) for k, v in value.items()}
+    if cls is list:
+        return [fast_clone(v) for v in value]
+    if cls in _ATOMIC:
+        return value
+    return copy.deepcopy(value)
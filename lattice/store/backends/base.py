@@ -2,11 +2,14 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Iterator, Optional
+from typing import Any, Iterable, Iterator, List, Optional
+import sys
 import time
 
+from ..._compat import SLOTS
 
-@dataclass
+
+@dataclass(**SLOTS)
 class StoredObject:
     """Serialized object representation stored in the backend."""
 
@@ -18,6 +21,11 @@ class StoredObject:
     created_at: float = field(default_factory=time.time)
     updated_at: float = field(default_factory=time.time)
 
+    def __post_init__(self) -> None:
+        # Few distinct type names are shared by many objects; intern them
+        # so rows loaded from a backend don't each hold their own copy.
+        self.type_name = sys.intern(self.type_name)
+
 
 class StorageBackend(ABC):
     """Abstract base class for storage backends.
@@ -26,6 +34,8 @@ class StorageBackend(ABC):
     while the Store class handles serialization, type registration, and the public API.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def connect(self, **kwargs) -> None:
         """Establish connection to storage.
@@ -52,6 +62,20 @@ class StorageBackend(ABC):
         """
         pass
 
+    def get_many(self, paths: Iterable[str]) -> List[StoredObject]:
+        """Retrieve several objects at once.
+
+        Backends with a round-trip cost per call should override this
+        to fetch all paths in one request.
+
+        Args:
+            paths: The object paths to retrieve
+
+        Returns:
+            StoredObjects for the paths that exist (missing paths are skipped)
+        """
+        return [obj for obj in map(self.get, paths) if obj is not None]
+
     @abstractmethod
     def put(self, obj: StoredObject) -> None:
         """Store or update object.
@@ -136,6 +160,35 @@ class StorageBackend(ABC):
         """
         pass
 
+    def begin_savepoint(self, handle: Any) -> Any:
+        """Mark a point inside the open transaction to roll back to.
+
+        Args:
+            handle: Transaction handle from begin_transaction()
+
+        Returns:
+            Savepoint handle (backend-specific), or None if not supported
+        """
+        return None
+
+    def release_savepoint(self, handle: Any, savepoint: Any) -> None:
+        """Keep the changes made since a savepoint in the open transaction.
+
+        Args:
+            handle: Transaction handle from begin_transaction()
+            savepoint: Savepoint handle from begin_savepoint()
+        """
+        pass
+
+    def rollback_to_savepoint(self, handle: Any, savepoint: Any) -> None:
+        """Undo the changes made since a savepoint; the transaction stays open.
+
+        Args:
+            handle: Transaction handle from begin_transaction()
+            savepoint: Savepoint handle from begin_savepoint()
+        """
+        pass
+
     @property
     def supports_transactions(self) -> bool:
         """Whether this backend supports transactions."""
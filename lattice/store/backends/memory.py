@@ -1,11 +1,19 @@
 """In-memory storage backend for testing."""
 
 import fnmatch
-from typing import Any, Dict, Iterator, Optional
+import functools
+import re
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 from .base import StorageBackend, StoredObject
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> "re.Pattern[str]":
+    """Compile a glob pattern to an anchored regex (cached per pattern)."""
+    return re.compile(fnmatch.translate(pattern))
+
+
 class MemoryBackend(StorageBackend):
     """In-memory storage backend.
 
@@ -20,19 +28,28 @@ class MemoryBackend(StorageBackend):
         obj = backend.get("/test")
     """
 
+    __slots__ = ("_data", "_connected", "_txn_log", "_txn_dirty")
+
     def __init__(self):
         self._data: Dict[str, StoredObject] = {}
         self._connected = False
+        # Undo log for the open transaction: (path, previous object or None)
+        self._txn_log: Optional[List[Tuple[str, Optional[StoredObject]]]] = None
+        self._txn_dirty: Set[str] = set()
 
     def connect(self, **kwargs) -> None:
         """Initialize the in-memory store."""
         self._data = {}
         self._connected = True
+        self._txn_log = None
+        self._txn_dirty.clear()
 
     def close(self) -> None:
         """Clear the in-memory store."""
         self._data.clear()
         self._connected = False
+        self._txn_log = None
+        self._txn_dirty.clear()
 
     def get(self, path: str) -> Optional[StoredObject]:
         """Retrieve object by path."""
@@ -40,11 +57,13 @@ class MemoryBackend(StorageBackend):
 
     def put(self, obj: StoredObject) -> None:
         """Store or update object."""
+        self._record_undo(obj.path)
         self._data[obj.path] = obj
 
     def delete(self, path: str) -> bool:
         """Delete object at path."""
         if path in self._data:
+            self._record_undo(path)
             del self._data[path]
             return True
         return False
@@ -75,24 +94,60 @@ class MemoryBackend(StorageBackend):
 
     def query(self, pattern: str) -> Iterator[str]:
         """Query paths matching glob pattern."""
-        for path in sorted(self._data.keys()):
-            if fnmatch.fnmatch(path, pattern):
-                yield path
+        yield from filter(_compile_glob(pattern).match, sorted(self._data))
+
+    # Transaction support - memory backend keeps an undo log of the
+    # previous value of each path the first time it is written
 
-    # Transaction support - memory backend uses simple copy-on-write
+    def _record_undo(self, path: str) -> None:
+        """Remember a path's current value before its first write in a transaction."""
+        if self._txn_log is not None and path not in self._txn_dirty:
+            self._txn_dirty.add(path)
+            self._txn_log.append((path, self._data.get(path)))
 
     def begin_transaction(self) -> Any:
-        """Begin a transaction by snapshotting current state."""
-        return dict(self._data)  # Shallow copy of the dict
+        """Begin a transaction by starting an empty undo log."""
+        self._txn_log = []
+        self._txn_dirty.clear()
+        return self._txn_log
 
     def commit_transaction(self, handle: Any) -> None:
-        """Commit transaction (nothing to do - changes already in place)."""
-        pass
+        """Commit transaction (changes already in place; drop the undo log)."""
+        self._txn_log = None
+        self._txn_dirty.clear()
 
     def rollback_transaction(self, handle: Any) -> None:
-        """Rollback transaction by restoring snapshot."""
-        if handle is not None:
-            self._data = handle
+        """Rollback transaction by replaying the undo log in reverse."""
+        if self._txn_log is not None:
+            for path, previous in reversed(self._txn_log):
+                if previous is None:
+                    self._data.pop(path, None)
+                else:
+                    self._data[path] = previous
+        self._txn_log = None
+        self._txn_dirty.clear()
+
+    def begin_savepoint(self, handle: Any) -> Any:
+        """Mark the undo log position; paths are logged afresh after it."""
+        savepoint = (len(self._txn_log), self._txn_dirty)
+        self._txn_dirty = set()
+        return savepoint
+
+    def release_savepoint(self, handle: Any, savepoint: Any) -> None:
+        """Keep changes since the savepoint (their undo entries stay logged)."""
+        _, dirty = savepoint
+        self._txn_dirty |= dirty
+
+    def rollback_to_savepoint(self, handle: Any, savepoint: Any) -> None:
+        """Replay the undo log back to the savepoint."""
+        position, dirty = savepoint
+        for path, previous in reversed(self._txn_log[position:]):
+            if previous is None:
+                self._data.pop(path, None)
+            else:
+                self._data[path] = previous
+        del self._txn_log[position:]
+        self._txn_dirty = dirty
 
     @property
     def supports_transactions(self) -> bool:
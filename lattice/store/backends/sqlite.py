@@ -1,12 +1,54 @@
 """SQLite storage backend."""
 
 import fnmatch
-import json
 import sqlite3
-from typing import Any, Iterator, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
+from ..._json import dumps, loads
 from .base import StorageBackend, StoredObject
 
+# Connection tuning applied on every connect. NORMAL sync is durable under
+# WAL and avoids an fsync per commit; the rest keeps hot pages in memory.
+_PRAGMAS = """
+PRAGMA synchronous=NORMAL;
+PRAGMA cache_size=-65536;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+"""
+
+# WAL has no effect on in-memory databases, so it is only set for files.
+_WAL_PRAGMA = "PRAGMA journal_mode=WAL;"
+
+# Size of sqlite3's per-connection prepared statement cache. Queries are
+# issued with bound parameters, so repeated get/put/query calls reuse
+# their compiled statements instead of re-parsing the SQL.
+_CACHED_STATEMENTS = 256
+
+# Paths per "IN (...)" query; stays under SQLite's default variable limit.
+_MAX_IN_PARAMS = 500
+
+
+def _prefix_range(prefix: str) -> Tuple[str, Optional[str]]:
+    """Return [low, high) bounds covering every string that starts with prefix.
+
+    high is None when there is no upper bound (empty prefix).
+    """
+    if not prefix:
+        return prefix, None
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def _is_prefix_glob(pattern: str) -> bool:
+    """True if pattern is a literal prefix followed by a single trailing '*'."""
+    return pattern.endswith("*") and not any(ch in pattern[:-1] for ch in "*?[")
+
+
+_INSERT_SQL = """
+    INSERT OR REPLACE INTO objects
+        (path, type_name, data, version, schema_version, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 class SQLiteBackend(StorageBackend):
     """SQLite storage backend.
@@ -25,6 +67,10 @@ class SQLiteBackend(StorageBackend):
     def __init__(self):
         self._conn: Optional[sqlite3.Connection] = None
         self._path: Optional[str] = None
+        # Rows buffered by put() while a transaction is open, keyed by path
+        # (None outside one)
+        self._pending: Optional[Dict[str, tuple]] = None
+        self._savepoint_seq = 0
 
     def connect(self, path: str = ":memory:", **kwargs) -> None:
         """Connect to SQLite database.
@@ -33,10 +79,19 @@ class SQLiteBackend(StorageBackend):
             path: Database file path, or ":memory:" for in-memory database
         """
         self._path = path
-        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn = sqlite3.connect(
+            path, check_same_thread=False, cached_statements=_CACHED_STATEMENTS
+        )
         self._conn.row_factory = sqlite3.Row
+        self._apply_pragmas()
         self._create_tables()
 
+    def _apply_pragmas(self) -> None:
+        """Apply performance pragmas to the open connection."""
+        if self._path != ":memory:":
+            self._conn.executescript(_WAL_PRAGMA)
+        self._conn.executescript(_PRAGMAS)
+
     def _create_tables(self) -> None:
         """Create the objects table if it doesn't exist."""
         self._conn.execute(
@@ -44,7 +99,7 @@ class SQLiteBackend(StorageBackend):
             CREATE TABLE IF NOT EXISTS objects (
                 path TEXT PRIMARY KEY,
                 type_name TEXT NOT NULL,
-                data TEXT NOT NULL,
+                data BLOB NOT NULL,
                 version INTEGER NOT NULL DEFAULT 1,
                 schema_version INTEGER NOT NULL DEFAULT 1,
                 created_at REAL NOT NULL,
@@ -54,7 +109,7 @@ class SQLiteBackend(StorageBackend):
         )
         # Migrate existing tables to add schema_version if needed
         self._migrate_schema()
-        # Index for prefix queries
+        # Index for prefix (range) queries
         self._conn.execute(
             """
             CREATE INDEX IF NOT EXISTS idx_objects_path ON objects(path)
@@ -76,56 +131,107 @@ class SQLiteBackend(StorageBackend):
         if self._conn:
             self._conn.close()
             self._conn = None
+        self._pending = None
+
+    def _flush_pending(self) -> None:
+        """Write rows buffered in the open transaction with one executemany."""
+        if self._pending:
+            self._conn.executemany(_INSERT_SQL, list(self._pending.values()))
+            self._pending.clear()
 
     def get(self, path: str) -> Optional[StoredObject]:
-        """Retrieve object by path."""
+        """Retrieve object by path.
+
+        A row buffered in the open transaction is returned without flushing,
+        so read-then-write loops (Store.__setitem__) keep filling the buffer.
+        """
+        if self._pending and path in self._pending:
+            return self._pending_to_object(self._pending[path])
         cursor = self._conn.execute(
             "SELECT * FROM objects WHERE path = ?", (path,)
         )
         row = cursor.fetchone()
         if row is None:
             return None
+        return self._row_to_object(row)
 
+    def get_many(self, paths: Iterable[str]) -> List[StoredObject]:
+        """Retrieve several objects with one SELECT per chunk of paths."""
+        self._flush_pending()
+        paths = list(paths)
+        result = []
+        for start in range(0, len(paths), _MAX_IN_PARAMS):
+            chunk = paths[start : start + _MAX_IN_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = self._conn.execute(
+                f"SELECT * FROM objects WHERE path IN ({placeholders})", chunk
+            )
+            result.extend(self._row_to_object(row) for row in cursor)
+        return result
+
+    @staticmethod
+    def _row_to_object(row: sqlite3.Row) -> StoredObject:
+        """Build a StoredObject from an objects table row."""
         return StoredObject(
             path=row["path"],
             type_name=row["type_name"],
-            data=json.loads(row["data"]),
+            data=loads(row["data"]),
             version=row["version"],
             schema_version=row["schema_version"],
             created_at=row["created_at"],
             updated_at=row["updated_at"],
         )
 
+    @staticmethod
+    def _pending_to_object(row: tuple) -> StoredObject:
+        """Build a StoredObject from a row tuple buffered by put()."""
+        path, type_name, data, version, schema_version, created_at, updated_at = row
+        return StoredObject(
+            path=path,
+            type_name=type_name,
+            data=loads(data),
+            version=version,
+            schema_version=schema_version,
+            created_at=created_at,
+            updated_at=updated_at,
+        )
+
     def put(self, obj: StoredObject) -> None:
-        """Store or update object."""
-        self._conn.execute(
-            """
-            INSERT OR REPLACE INTO objects
-                (path, type_name, data, version, schema_version, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                obj.path,
-                obj.type_name,
-                json.dumps(obj.data),
-                obj.version,
-                obj.schema_version,
-                obj.created_at,
-                obj.updated_at,
-            ),
+        """Store or update object.
+
+        Inside a transaction the row is buffered and written in bulk on
+        commit (or before the next multi-row read); otherwise it is written and
+        committed immediately.
+        """
+        row = (
+            obj.path,
+            obj.type_name,
+            dumps(obj.data),
+            obj.version,
+            obj.schema_version,
+            obj.created_at,
+            obj.updated_at,
         )
+        if self._pending is not None:
+            self._pending[obj.path] = row
+            return
+        self._conn.execute(_INSERT_SQL, row)
         self._conn.commit()
 
     def delete(self, path: str) -> bool:
         """Delete object at path."""
+        self._flush_pending()
         cursor = self._conn.execute(
             "DELETE FROM objects WHERE path = ?", (path,)
         )
-        self._conn.commit()
+        if self._pending is None:
+            self._conn.commit()
         return cursor.rowcount > 0
 
     def exists(self, path: str) -> bool:
         """Check if path exists."""
+        if self._pending and path in self._pending:
+            return True
         cursor = self._conn.execute(
             "SELECT 1 FROM objects WHERE path = ?", (path,)
         )
@@ -137,11 +243,8 @@ class SQLiteBackend(StorageBackend):
         if not prefix.endswith("/"):
             prefix = prefix + "/"
 
-        # Use LIKE for prefix matching
-        cursor = self._conn.execute(
-            "SELECT path FROM objects WHERE path LIKE ? ORDER BY path",
-            (prefix + "%",),
-        )
+        self._flush_pending()
+        cursor = self._select_prefix(prefix)
 
         for row in cursor:
             path = row["path"]
@@ -160,31 +263,75 @@ class SQLiteBackend(StorageBackend):
         Note: SQLite GLOB is case-sensitive and uses * and ? wildcards,
         matching fnmatch behavior.
         """
-        # Convert fnmatch pattern to SQL GLOB pattern
-        # fnmatch uses * and ? which map directly to GLOB
-        cursor = self._conn.execute(
-            "SELECT path FROM objects WHERE path GLOB ? ORDER BY path",
-            (pattern,),
-        )
+        self._flush_pending()
+        if _is_prefix_glob(pattern):
+            # "prefix*" is a plain range scan on the path index
+            cursor = self._select_prefix(pattern[:-1])
+        else:
+            # Convert fnmatch pattern to SQL GLOB pattern
+            # fnmatch uses * and ? which map directly to GLOB
+            cursor = self._conn.execute(
+                "SELECT path FROM objects WHERE path GLOB ? ORDER BY path",
+                (pattern,),
+            )
 
         for row in cursor:
             yield row["path"]
 
+    def _select_prefix(self, prefix: str) -> sqlite3.Cursor:
+        """Select paths starting with prefix using an index range scan.
+
+        Unlike LIKE, this is case-sensitive and treats '_' and '%' literally.
+        """
+        low, high = _prefix_range(prefix)
+        if high is None:
+            return self._conn.execute(
+                "SELECT path FROM objects WHERE path >= ? ORDER BY path", (low,)
+            )
+        return self._conn.execute(
+            "SELECT path FROM objects WHERE path >= ? AND path < ? ORDER BY path",
+            (low, high),
+        )
+
     # Transaction support
 
     def begin_transaction(self) -> Any:
         """Begin a transaction."""
-        self._conn.execute("BEGIN TRANSACTION")
+        self._conn.execute("BEGIN IMMEDIATE")
+        self._pending = {}
         return True
 
     def commit_transaction(self, handle: Any) -> None:
-        """Commit transaction."""
+        """Commit transaction, flushing buffered puts first."""
+        try:
+            self._flush_pending()
+        finally:
+            self._pending = None
         self._conn.commit()
 
     def rollback_transaction(self, handle: Any) -> None:
-        """Rollback transaction."""
+        """Rollback transaction, discarding buffered puts."""
+        self._pending = None
         self._conn.rollback()
 
+    def begin_savepoint(self, handle: Any) -> Any:
+        """Open a SAVEPOINT, flushing buffered puts so they stay before it."""
+        self._flush_pending()
+        self._savepoint_seq += 1
+        name = f"lattice_sp{self._savepoint_seq}"
+        self._conn.execute(f"SAVEPOINT {name}")
+        return name
+
+    def release_savepoint(self, handle: Any, savepoint: Any) -> None:
+        """Release a savepoint; buffered puts stay pending until commit."""
+        self._conn.execute(f"RELEASE {savepoint}")
+
+    def rollback_to_savepoint(self, handle: Any, savepoint: Any) -> None:
+        """Roll back to a savepoint, discarding puts buffered since it."""
+        self._pending.clear()
+        self._conn.execute(f"ROLLBACK TO {savepoint}")
+        self._conn.execute(f"RELEASE {savepoint}")
+
     @property
     def supports_transactions(self) -> bool:
         """SQLite supports transactions."""
@@ -3,7 +3,7 @@
 from contextlib import contextmanager
 import time
 import weakref
-from typing import Any, Dict, Iterator, Optional, Type, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type, Union
 from urllib.parse import urlparse
 
 import dag
@@ -58,11 +58,15 @@ class Store:
             backend: Storage backend instance
         """
         self._backend = backend
+        # Created once and reused for every operation so the serializer's
+        # per-class caches survive across reads and writes.
         self._type_registry = TypeRegistry()
         self._serializer = Serializer()
         self._identity_map: Dict[str, dag.Model] = {}  # path -> loaded object
         self._object_paths: Dict[int, str] = {}  # id(obj) -> path
         self._in_transaction = False
+        self._implicit_transaction = False  # opened by `with store:`
+        self._batch_writes = False  # inside `with store:`; begin on first write
         self._tx_handle = None
 
     # Type registration
@@ -96,15 +100,22 @@ class Store:
             NotFoundError: If no object exists at path
             TypeNotRegisteredError: If no type registered for path pattern
         """
-        # Check identity map first (already loaded)
-        if path in self._identity_map:
-            return self._identity_map[path]
+        # Check identity map first (already loaded) - a single dict lookup
+        obj = self._identity_map.get(path)
+        if obj is not None:
+            return obj
 
         # Load from backend
         stored = self._backend.get(path)
         if stored is None:
             raise NotFoundError(path)
 
+        return self._hydrate(stored)
+
+    def _hydrate(self, stored: StoredObject) -> dag.Model:
+        """Deserialize a StoredObject and register it in the identity map."""
+        path = stored.path
+
         # Get the type
         cls = self._type_registry.get_type(path)
         if cls is None:
@@ -138,28 +149,38 @@ class Store:
             expected = self._type_registry.get_type(path)
             raise TypeMismatchError(path, expected, type(obj))
 
+        self._begin_implicit_transaction()
+
         # Serialize
         data = self._serializer.serialize(obj)
 
         # Get schema version from class
         schema_version = self._serializer.get_schema_version(type(obj))
+        type_name = type(obj).__name__
 
-        # Create stored object
-        now = time.time()
+        # Skip the backend write if the stored row already has this content
         existing = self._backend.get(path)
+        if (
+            existing is None
+            or existing.type_name != type_name
+            or existing.schema_version != schema_version
+            or existing.data != data
+        ):
+            # Create stored object
+            now = time.time()
+
+            stored = StoredObject(
+                path=path,
+                type_name=type_name,
+                data=data,
+                version=existing.version + 1 if existing else 1,
+                schema_version=schema_version,
+                created_at=existing.created_at if existing else now,
+                updated_at=now,
+            )
 
-        stored = StoredObject(
-            path=path,
-            type_name=type(obj).__name__,
-            data=data,
-            version=existing.version + 1 if existing else 1,
-            schema_version=schema_version,
-            created_at=existing.created_at if existing else now,
-            updated_at=now,
-        )
-
-        # Store
-        self._backend.put(stored)
+            # Store
+            self._backend.put(stored)
 
         # Set object's store awareness
         obj._store_ref = weakref.ref(self)
@@ -178,6 +199,7 @@ class Store:
         Raises:
             NotFoundError: If no object exists at path
         """
+        self._begin_implicit_transaction()
         if not self._backend.delete(path):
             raise NotFoundError(path)
 
@@ -282,6 +304,37 @@ class Store:
         """
         return self._backend.query(pattern)
 
+    def get_many(self, paths: Iterable[str]) -> List[dag.Model]:
+        """Retrieve several objects, fetching uncached ones in one backend call.
+
+        Args:
+            paths: Object paths (e.g., from list() or query())
+
+        Returns:
+            The Model instances, in the order of paths
+
+        Raises:
+            NotFoundError: If any path has no object
+            TypeNotRegisteredError: If no type registered for a path pattern
+
+        Example:
+            options = db.get_many(db.query("/Instruments/AAPL_*"))
+        """
+        paths = list(paths)
+        missing = [p for p in paths if p not in self._identity_map]
+        if missing:
+            for stored in self._backend.get_many(missing):
+                if stored.path not in self._identity_map:
+                    self._hydrate(stored)
+
+        result = []
+        for path in paths:
+            obj = self._identity_map.get(path)
+            if obj is None:
+                raise NotFoundError(path)
+            result.append(obj)
+        return result
+
     def get(self, path: str, default: Any = None) -> Optional[dag.Model]:
         """Get object at path, or default if not found.
 
@@ -306,12 +359,32 @@ class Store:
         Changes within the transaction are committed on successful exit,
         or rolled back on exception.
 
+        Inside a `with store:` block, the transaction runs as a savepoint
+        in the block's implicit transaction: its writes commit with the
+        block, and an exception rolls back only the writes made inside it.
+
         Example:
             with db.transaction():
                 db["/Books/NEW"] = book
                 db["/Positions/NEW/AAPL"] = position
                 # Both committed atomically
         """
+        if self._batch_writes:
+            self._begin_implicit_transaction()
+            savepoint = self._backend.begin_savepoint(self._tx_handle)
+            try:
+                yield
+            except Exception:
+                if self._implicit_transaction:
+                    self._backend.rollback_to_savepoint(self._tx_handle, savepoint)
+                    # Objects written since the savepoint may be stale
+                    self._identity_map.clear()
+                    self._object_paths.clear()
+                raise
+            if self._implicit_transaction:
+                self._backend.release_savepoint(self._tx_handle, savepoint)
+            return
+
         if self._in_transaction:
             # Nested transaction - just yield (changes go to outer tx)
             yield
@@ -322,36 +395,92 @@ class Store:
             yield
             return
 
+        self._begin_transaction()
+        try:
+            yield
+            self._commit_transaction()
+        except Exception:
+            self._rollback_transaction()
+            raise
+
+    def _begin_implicit_transaction(self) -> None:
+        """Open the `with store:` block's transaction before its first write.
+
+        Beginning lazily keeps read-only blocks from holding a write lock
+        (SQLite takes its RESERVED lock at BEGIN IMMEDIATE).
+        """
+        if self._batch_writes and not self._in_transaction:
+            self._begin_transaction(implicit=True)
+
+    def _begin_transaction(self, implicit: bool = False) -> None:
+        """Open a backend transaction."""
         self._in_transaction = True
+        self._implicit_transaction = implicit
         self._tx_handle = self._backend.begin_transaction()
+
+    def _commit_transaction(self) -> None:
+        """Commit the open backend transaction."""
         try:
-            yield
             self._backend.commit_transaction(self._tx_handle)
-        except Exception:
+        finally:
+            self._end_transaction()
+
+    def _rollback_transaction(self) -> None:
+        """Roll back the open backend transaction."""
+        try:
             self._backend.rollback_transaction(self._tx_handle)
+        finally:
+            self._end_transaction()
             # Clear identity map on rollback (objects may be stale)
             self._identity_map.clear()
             self._object_paths.clear()
-            raise
-        finally:
-            self._in_transaction = False
-            self._tx_handle = None
+
+    def _end_transaction(self) -> None:
+        self._in_transaction = False
+        self._implicit_transaction = False
+        self._tx_handle = None
 
     # Lifecycle
 
     def close(self) -> None:
-        """Close the store and release resources."""
-        self._backend.close()
-        self._identity_map.clear()
-        self._object_paths.clear()
+        """Close the store and release resources.
+
+        Writes made inside an open `with store:` block are committed first.
+        """
+        try:
+            if self._implicit_transaction:
+                self._commit_transaction()
+        finally:
+            self._batch_writes = False
+            self._backend.close()
+            self._identity_map.clear()
+            self._object_paths.clear()
 
     def __enter__(self) -> "Store":
-        """Context manager entry."""
+        """Context manager entry.
+
+        Writes inside the block are batched into an implicit transaction
+        and applied atomically (one commit for SQLite). The transaction is
+        opened by the block's first write, so read-only blocks take no lock.
+        """
+        if self._backend.supports_transactions and not self._in_transaction:
+            self._batch_writes = True
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Context manager exit."""
-        self.close()
+        """Context manager exit.
+
+        Commits the block's writes, or rolls them back if the block raised,
+        then closes the store.
+        """
+        try:
+            if self._implicit_transaction:
+                if exc_type is None:
+                    self._commit_transaction()
+                else:
+                    self._rollback_transaction()
+        finally:
+            self.close()
 
     # Utility
 
@@ -2,15 +2,27 @@
 
 import fnmatch
 import json
+import re
 import warnings
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Tuple, Type
 
 import dag
 from dag.flags import Flags
 
+from ._clone import fast_clone
 from .exceptions import SerializationError, TypeNotRegisteredError
 
+_GLOB_CHARS = "*?["
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Return the part of a glob pattern before its first wildcard."""
+    for i, ch in enumerate(pattern):
+        if ch in _GLOB_CHARS:
+            return pattern[:i]
+    return pattern
+
 
 class TypeRegistry:
     """Maps path patterns to Model types.
@@ -26,9 +38,16 @@ class TypeRegistry:
         cls = registry.get_type("/Instruments/AAPL_C_150")  # VanillaOption
     """
 
+    __slots__ = ("_patterns", "_type_to_pattern", "_exact", "_globs")
+
     def __init__(self):
         self._patterns: List[Tuple[str, Type[dag.Model]]] = []
         self._type_to_pattern: Dict[Type[dag.Model], str] = {}
+        # Lookup structures derived from _patterns. Exact paths go in a dict;
+        # globs keep their registration index, literal prefix and compiled
+        # matcher so get_type() can preserve first-match-wins ordering.
+        self._exact: Dict[str, Tuple[int, Type[dag.Model]]] = {}
+        self._globs: List[Tuple[int, str, Callable[[str], Any], Type[dag.Model]]] = []
 
     def register(self, pattern: str, cls: Type[dag.Model]) -> None:
         """Register a path pattern for a Model type.
@@ -39,9 +58,17 @@ class TypeRegistry:
 
         Patterns are matched in registration order (first match wins).
         """
+        index = len(self._patterns)
         self._patterns.append((pattern, cls))
         self._type_to_pattern[cls] = pattern
 
+        prefix = _literal_prefix(pattern)
+        if prefix == pattern:
+            self._exact.setdefault(pattern, (index, cls))
+        else:
+            matcher = re.compile(fnmatch.translate(pattern)).match
+            self._globs.append((index, prefix, matcher, cls))
+
     def get_type(self, path: str) -> Optional[Type[dag.Model]]:
         """Get the Model type for a path.
 
@@ -51,10 +78,15 @@ class TypeRegistry:
         Returns:
             The registered Model class, or None if no pattern matches
         """
-        for pattern, cls in self._patterns:
-            if fnmatch.fnmatch(path, pattern):
+        exact = self._exact.get(path)
+        # Only globs registered before an exact match can take precedence
+        limit = exact[0] if exact is not None else len(self._patterns)
+        for index, prefix, matcher, cls in self._globs:
+            if index > limit:
+                break
+            if path.startswith(prefix) and matcher(path):
                 return cls
-        return None
+        return exact[1] if exact is not None else None
 
     def get_pattern(self, cls: Type[dag.Model]) -> Optional[str]:
         """Get the registered pattern for a Model type.
@@ -84,6 +116,57 @@ class TypeRegistry:
         """Remove all registered patterns."""
         self._patterns.clear()
         self._type_to_pattern.clear()
+        self._exact.clear()
+        self._globs.clear()
+
+
+class _FieldPlan(NamedTuple):
+    """Per-class field layout used by Serializer, computed once per class."""
+
+    # serialize(obj, to_json) -> dict of Serialized field values
+    serialize: Callable[[Any, Callable[[Any], Any]], Dict[str, Any]]
+    # restore(obj, data, from_json) sets every settable field present in data
+    restore: Callable[[Any, Dict[str, Any], Callable[[Any], Any]], None]
+    # Serialized | Input fields that deserialize() can set
+    settable: FrozenSet[str]
+    # Serialized fields without Input (persisted but read-only)
+    readonly: FrozenSet[str]
+    # All computed function names on the class
+    known: FrozenSet[str]
+
+
+def _compile_plan_functions(
+    serialized: List[str], settable: List[str]
+) -> Tuple[Callable, Callable]:
+    """Generate serialize/restore functions with the field names baked in.
+
+    The generated code is a single dict literal for serialize and a flat
+    sequence of set() calls for restore, so neither loops over fields.
+
+    Args:
+        serialized: Names of Serialized fields, in class order
+        settable: Names of Serialized | Input fields, in class order
+
+    Returns:
+        Tuple of (serialize, restore) functions
+    """
+
+    def accessor(name: str) -> str:
+        # Computed function names come from def statements, so they are
+        # normally identifiers; fall back to getattr just in case.
+        return f"obj.{name}" if name.isidentifier() else f"getattr(obj, {name!r})"
+
+    lines = ["def serialize(obj, to_json):", "    return {"]
+    lines += [f"        {name!r}: to_json({accessor(name)}())," for name in serialized]
+    lines += ["    }", "", "def restore(obj, data, from_json):"]
+    for name in settable:
+        lines.append(f"    if {name!r} in data:")
+        lines.append(f"        {accessor(name)}.set(from_json(data[{name!r}]))")
+    lines.append("    return None")
+
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["serialize"], namespace["restore"]
 
 
 class Serializer:
@@ -112,6 +195,8 @@ class Serializer:
         serializer.register_migration(VanillaOption, 1, 2, migrate_v1_to_v2)
     """
 
+    __slots__ = ("strict", "warn_extra_fields", "_migrations", "_plan_cache")
+
     def __init__(self, strict: bool = False, warn_extra_fields: bool = True):
         """Initialize the serializer.
 
@@ -123,6 +208,10 @@ class Serializer:
         self.warn_extra_fields = warn_extra_fields
         # Migrations: {cls: {(from_version, to_version): migrator_func}}
         self._migrations: Dict[Type, Dict[Tuple[int, int], Callable]] = {}
+        # Field plans per class, built lazily on first use. Caches are
+        # per-instance (not module-global) so that each Store owns its own
+        # and test fixtures that reset dag start clean.
+        self._plan_cache: Dict[Type, _FieldPlan] = {}
 
     def register_migration(
         self,
@@ -177,7 +266,8 @@ class Serializer:
 
         migrations = self._migrations.get(cls, {})
         current = from_version
-        result = data.copy()
+        # Deep copy so migrators can't mutate the backend's stored data
+        result = fast_clone(data)
 
         while current < to_version:
             # Look for a direct migration or step-by-step
@@ -217,6 +307,39 @@ class Serializer:
         """
         return getattr(cls, "_schema_version_", 1)
 
+    def _plan_for(self, obj: dag.Model) -> _FieldPlan:
+        """Get the field plan for an object's class.
+
+        The plan is computed once per class from its computed function
+        descriptors and cached.
+
+        Args:
+            obj: A Model instance
+
+        Returns:
+            The class's _FieldPlan
+        """
+        cls = type(obj)
+        plan = self._plan_cache.get(cls)
+        if plan is None:
+            descriptors = obj._computed_functions_
+            serialized = [
+                name for name, d in descriptors.items() if d.flags & Flags.Serialized
+            ]
+            settable = [
+                name for name in serialized if descriptors[name].flags & Flags.Input
+            ]
+            serialize, restore = _compile_plan_functions(serialized, settable)
+            plan = _FieldPlan(
+                serialize=serialize,
+                restore=restore,
+                settable=frozenset(settable),
+                readonly=frozenset(serialized).difference(settable),
+                known=frozenset(descriptors),
+            )
+            self._plan_cache[cls] = plan
+        return plan
+
     def serialize(self, obj: dag.Model) -> Dict[str, Any]:
         """Serialize a Model to a dictionary.
 
@@ -234,15 +357,8 @@ class Serializer:
             SerializationError: If serialization fails
         """
         try:
-            data = {}
-            for name, descriptor in obj._computed_functions_.items():
-                # Only persist fields with Serialized flag
-                if descriptor.flags & Flags.Serialized:
-                    accessor = getattr(obj, name)
-                    value = accessor()
-                    # Convert to JSON-compatible format
-                    data[name] = self._to_json_compatible(value)
-            return data
+            # Only persist fields with Serialized flag, converted to JSON format
+            return self._plan_for(obj).serialize(obj, self._to_json_compatible)
         except Exception as e:
             raise SerializationError(f"Failed to serialize {type(obj).__name__}: {e}")
 
@@ -272,20 +388,26 @@ class Serializer:
             SerializationError: If deserialization fails (in strict mode)
         """
         try:
-            # Apply migrations if needed
-            current_version = self.get_schema_version(cls)
-            if schema_version is not None and schema_version < current_version:
-                data = self._apply_migrations(cls, data, schema_version, current_version)
+            # Apply migrations if needed. Data without a version, or already at
+            # the class's version, goes straight to the field restore.
+            if schema_version is not None:
+                current_version = self.get_schema_version(cls)
+                if schema_version < current_version:
+                    data = self._apply_migrations(
+                        cls, data, schema_version, current_version
+                    )
 
             obj = cls()
 
-            # Track which fields in data we actually use
-            used_fields = set()
+            plan = self._plan_for(obj)
 
-            for name, value in data.items():
-                descriptor = obj._computed_functions_.get(name)
+            # Only restore fields that have Serialized flag AND can be set (Input flag)
+            plan.restore(obj, data, self._from_json_compatible)
 
-                if descriptor is None:
+            for name in data:
+                if name in plan.settable:
+                    continue
+                if name not in plan.known:
                     # Field exists in data but not in class (removed field)
                     if self.strict:
                         raise SerializationError(
@@ -298,23 +420,14 @@ class Serializer:
                             f"This field may have been removed from the class definition.",
                             UserWarning,
                         )
-                    continue
-
-                # Only restore fields that have Serialized flag AND can be set (Input flag)
-                if descriptor.flags & Flags.Serialized:
-                    if descriptor.flags & Flags.Input:
-                        # Convert from JSON format and set
-                        converted = self._from_json_compatible(value)
-                        getattr(obj, name).set(converted)
-                        used_fields.add(name)
-                    else:
-                        # Serialized but not Input - read-only persisted field
-                        # We can't set it, so just skip (it will use its computed value)
-                        warnings.warn(
-                            f"Field '{name}' in {cls.__name__} is Serialized but not Input. "
-                            f"Cannot restore value; using computed default.",
-                            UserWarning,
-                        )
+                elif name in plan.readonly:
+                    # Serialized but not Input - read-only persisted field
+                    # We can't set it, so just skip (it will use its computed value)
+                    warnings.warn(
+                        f"Field '{name}' in {cls.__name__} is Serialized but not Input. "
+                        f"Cannot restore value; using computed default.",
+                        UserWarning,
+                    )
 
             return obj
         except SerializationError:
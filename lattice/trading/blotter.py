@@ -32,6 +32,11 @@ class TradeBlotter:
         ])
         self._table = livetable.Table("trades", schema)
         self._next_trade_id = 1
+        # Row indices per symbol and per side, maintained by record() so the
+        # common lookups don't scan the whole table (trades are append-only)
+        self._rows_by_symbol: dict[str, list[int]] = {}
+        self._rows_by_side: dict[str, list[int]] = {"BUY": [], "SELL": []}
+        self._total_notional = 0.0
 
     def record(
         self,
@@ -63,6 +68,7 @@ class TradeBlotter:
         trade_id = self._next_trade_id
         self._next_trade_id += 1
 
+        notional = quantity * price
         self._table.append_row({
             "trade_id": trade_id,
             "timestamp": timestamp.isoformat(),
@@ -70,9 +76,14 @@ class TradeBlotter:
             "side": side,
             "quantity": quantity,
             "price": price,
-            "notional": quantity * price,
+            "notional": notional,
         })
 
+        row_idx = len(self._table) - 1
+        self._rows_by_symbol.setdefault(symbol, []).append(row_idx)
+        self._rows_by_side[side].append(row_idx)
+        self._total_notional += notional
+
         return trade_id
 
     def filter(self, predicate: Callable[[dict], bool]) -> "TradeBlotterView":
@@ -90,15 +101,16 @@ class TradeBlotter:
 
     def by_symbol(self, symbol: str) -> "TradeBlotterView":
         """Get all trades for a specific symbol."""
-        return self.filter(lambda r: r["symbol"] == symbol)
+        rows = self._rows_by_symbol.get(symbol, ())
+        return TradeBlotterView(_RowSubset(self._table, list(rows)))
 
     def buys(self) -> "TradeBlotterView":
         """Get all buy trades."""
-        return self.filter(lambda r: r["side"] == "BUY")
+        return TradeBlotterView(_RowSubset(self._table, list(self._rows_by_side["BUY"])))
 
     def sells(self) -> "TradeBlotterView":
         """Get all sell trades."""
-        return self.filter(lambda r: r["side"] == "SELL")
+        return TradeBlotterView(_RowSubset(self._table, list(self._rows_by_side["SELL"])))
 
     def __len__(self) -> int:
         """Return the number of trades."""
@@ -116,7 +128,7 @@ class TradeBlotter:
     @property
     def total_notional(self) -> float:
         """Total notional value of all trades."""
-        return self._table.sum("notional")
+        return self._total_notional
 
 
     def show(self, port: int = 8080, open_browser: bool = True) -> None:
@@ -176,6 +188,22 @@ class TradeBlotter:
         )
 
 
+class _RowSubset:
+    """Rows of a table selected by a list of row indices."""
+
+    __slots__ = ("_table", "_rows")
+
+    def __init__(self, table, rows: list[int]):
+        self._table = table
+        self._rows = rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, index: int) -> dict:
+        return self._table[self._rows[index]]
+
+
 class TradeBlotterView:
     """Read-only view of filtered trades."""
 
@@ -3,6 +3,26 @@
 from dataclasses import dataclass, field
 from typing import Any, Optional, Callable
 from enum import Enum, auto
+import functools
+import re
+import sys
+
+from .._compat import SLOTS
+
+
+# Insert a space before each capital: TimeToExpiry -> Time To Expiry
+_PASCAL_SPLIT = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+@functools.lru_cache(maxsize=1024)
+def _default_label(name: str) -> str:
+    """Convert a PascalCase node name to a Title Case label."""
+    return _PASCAL_SPLIT.sub(" ", name)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern a short, frequently repeated binding string (labels, formats)."""
+    return sys.intern(value) if isinstance(value, str) else value
 
 
 class BindingType(Enum):
@@ -13,7 +33,7 @@ class BindingType(Enum):
     TWO_WAY = auto()    # Both editable and displays computed value
 
 
-@dataclass
+@dataclass(**SLOTS)
 class Binding:
     """
     Base class for UI bindings to dag nodes.
@@ -56,10 +76,7 @@ class Binding:
             name = getattr(descriptor, "name", "Unknown")
         else:
             name = getattr(self.computed_func, "__name__", "Unknown")
-        # Convert PascalCase to Title Case
-        # Insert space before capitals: TimeToExpiry -> Time To Expiry
-        import re
-        return re.sub(r"(?<!^)(?=[A-Z])", " ", name)
+        return _default_label(name)
 
     def to_dict(self) -> dict:
         """Convert binding to dictionary for serialization."""
@@ -77,27 +94,34 @@ class Binding:
         }
 
 
-@dataclass
+@dataclass(**SLOTS)
 class InputBinding(Binding):
     """Binding for user-editable inputs (requires dag.Input flag)."""
 
     binding_type: BindingType = field(default=BindingType.INPUT, init=False)
 
 
-@dataclass
+@dataclass(**SLOTS)
 class OutputBinding(Binding):
     """Binding for display-only computed values."""
 
     binding_type: BindingType = field(default=BindingType.OUTPUT, init=False)
 
 
-@dataclass
+@dataclass(**SLOTS)
 class TwoWayBinding(Binding):
     """Binding for values that are both editable and computed."""
 
     binding_type: BindingType = field(default=BindingType.TWO_WAY, init=False)
 
 
+_BINDING_CLASSES = {
+    BindingType.INPUT: InputBinding,
+    BindingType.OUTPUT: OutputBinding,
+    BindingType.TWO_WAY: TwoWayBinding,
+}
+
+
 def bind(
     computed_func: Any,
     label: Optional[str] = None,
@@ -151,17 +175,13 @@ def bind(
         binding_type = _infer_binding_type(computed_func)
 
     # Create appropriate binding class
-    binding_class = {
-        BindingType.INPUT: InputBinding,
-        BindingType.OUTPUT: OutputBinding,
-        BindingType.TWO_WAY: TwoWayBinding,
-    }[binding_type]
+    binding_class = _BINDING_CLASSES[binding_type]
 
     return binding_class(
         computed_func=computed_func,
-        label=label,
-        format=format,
-        widget_type=widget_type,
+        label=_intern(label),
+        format=_intern(format),
+        widget_type=_intern(widget_type),
         min_value=min_value,
         max_value=max_value,
         step=step,
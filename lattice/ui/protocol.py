@@ -1,9 +1,35 @@
 """WebSocket protocol message types for dag UI communication."""
 
 from dataclasses import dataclass, field, asdict
-from typing import Any, Optional
+from typing import Any, Optional, Union
 from enum import Enum
-import json
+
+from .._compat import SLOTS
+from .._json import dumps, loads
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+    msgpack = None
+
+
+def _dumps(data: dict[str, Any]) -> str:
+    """Encode a payload as JSON text (orjson when available, else stdlib json).
+
+    NaN and infinity are written as NaN/Infinity on either path, as stdlib
+    json does, rather than as orjson's null.
+    """
+    encoded = dumps(data)
+    return encoded.decode() if isinstance(encoded, bytes) else encoded
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """Convert values msgpack cannot pack natively (numpy scalars and arrays)."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Cannot serialize {type(obj).__name__} to MessagePack")
 
 
 class MessageType(Enum):
@@ -19,53 +45,61 @@ class MessageType(Enum):
     # Server -> Client
     CONNECTED = "connected"
     VALUE = "value"
+    VALUES = "values"
     INVALIDATED = "invalidated"
     ERROR = "error"
     SCHEMA = "schema"
 
 
-@dataclass
+@dataclass(**SLOTS)
 class Message:
     """Base message class."""
 
     type: MessageType
 
-    def to_json(self) -> str:
-        """Serialize message to JSON string."""
+    def to_dict(self) -> dict[str, Any]:
+        """Convert message to a plain dict with the type as its string value."""
         data = asdict(self)
         data["type"] = self.type.value
-        return json.dumps(data)
+        return data
+
+    def to_json(self) -> str:
+        """Serialize message to JSON string."""
+        return _dumps(self.to_dict())
+
+    def to_bytes(self) -> bytes:
+        """Serialize message to MessagePack bytes for binary WebSocket frames."""
+        if not HAS_MSGPACK:
+            raise ImportError(
+                "msgpack is required for the binary protocol. "
+                "Install with: pip install msgpack"
+            )
+        return msgpack.packb(self.to_dict(), use_bin_type=True, default=_msgpack_default)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Message":
+        """Build the appropriate message subclass from a decoded payload."""
+        return _from_payload(dict(data))
 
     @classmethod
     def from_json(cls, json_str: str) -> "Message":
         """Deserialize message from JSON string."""
-        data = json.loads(json_str)
-        msg_type = MessageType(data.pop("type"))
-
-        # Route to appropriate message class
-        message_classes = {
-            MessageType.SUBSCRIBE: SubscribeMessage,
-            MessageType.UNSUBSCRIBE: UnsubscribeMessage,
-            MessageType.SET: SetMessage,
-            MessageType.OVERRIDE: OverrideMessage,
-            MessageType.CLEAR_OVERRIDE: ClearOverrideMessage,
-            MessageType.CONNECTED: ConnectedMessage,
-            MessageType.VALUE: ValueMessage,
-            MessageType.INVALIDATED: InvalidatedMessage,
-            MessageType.ERROR: ErrorMessage,
-            MessageType.SCHEMA: SchemaMessage,
-        }
-
-        msg_cls = message_classes.get(msg_type)
-        if msg_cls is None:
-            raise ValueError(f"Unknown message type: {msg_type}")
-
-        return msg_cls(**data)
+        return _from_payload(loads(json_str))
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> "Message":
+        """Deserialize message from MessagePack bytes."""
+        if not HAS_MSGPACK:
+            raise ImportError(
+                "msgpack is required for the binary protocol. "
+                "Install with: pip install msgpack"
+            )
+        return _from_payload(msgpack.unpackb(payload, raw=False))
 
 
 # Client -> Server messages
 
-@dataclass
+@dataclass(**SLOTS)
 class SubscribeMessage(Message):
     """Subscribe to node value updates."""
 
@@ -73,7 +107,7 @@ class SubscribeMessage(Message):
     node_paths: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**SLOTS)
 class UnsubscribeMessage(Message):
     """Unsubscribe from node value updates."""
 
@@ -81,7 +115,7 @@ class UnsubscribeMessage(Message):
     node_paths: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**SLOTS)
 class SetMessage(Message):
     """Permanently set a node's value (requires Input flag)."""
 
@@ -90,7 +124,7 @@ class SetMessage(Message):
     value: Any = None
 
 
-@dataclass
+@dataclass(**SLOTS)
 class OverrideMessage(Message):
     """Temporarily override a node's value (requires Overridable flag)."""
 
@@ -99,7 +133,7 @@ class OverrideMessage(Message):
     value: Any = None
 
 
-@dataclass
+@dataclass(**SLOTS)
 class ClearOverrideMessage(Message):
     """Clear an override, reverting to computed/set value."""
 
@@ -109,7 +143,7 @@ class ClearOverrideMessage(Message):
 
 # Server -> Client messages
 
-@dataclass
+@dataclass(**SLOTS)
 class ConnectedMessage(Message):
     """Sent when client connects successfully."""
 
@@ -118,7 +152,7 @@ class ConnectedMessage(Message):
     server_version: str = "0.1.0"
 
 
-@dataclass
+@dataclass(**SLOTS)
 class ValueMessage(Message):
     """Send current value of a node."""
 
@@ -128,7 +162,20 @@ class ValueMessage(Message):
     formatted: Optional[str] = None  # Pre-formatted display string
 
 
-@dataclass
+@dataclass(**SLOTS)
+class ValueBatchMessage(Message):
+    """Send current values of several nodes in one frame."""
+
+    type: MessageType = field(default=MessageType.VALUES, init=False)
+    items: list[dict[str, Any]] = field(default_factory=list)
+    # Each item: {"node_path": str, "value": Any, "formatted": Optional[str]}
+
+    def add(self, node_path: str, value: Any, formatted: Optional[str] = None) -> None:
+        """Append a node value to the batch."""
+        self.items.append({"node_path": node_path, "value": value, "formatted": formatted})
+
+
+@dataclass(**SLOTS)
 class InvalidatedMessage(Message):
     """Notify that nodes have been invalidated and need re-evaluation."""
 
@@ -136,7 +183,7 @@ class InvalidatedMessage(Message):
     node_paths: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**SLOTS)
 class ErrorMessage(Message):
     """Send error information to client."""
 
@@ -145,7 +192,7 @@ class ErrorMessage(Message):
     node_path: Optional[str] = None  # Optional: which node caused the error
 
 
-@dataclass
+@dataclass(**SLOTS)
 class SchemaMessage(Message):
     """Send model schema to client for auto-layout generation."""
 
@@ -154,9 +201,45 @@ class SchemaMessage(Message):
     # Structure: {"model_name": {"inputs": [...], "outputs": [...], "computed": [...]}}
 
 
-def parse_message(json_str: str) -> Message:
-    """Parse a JSON string into a Message object."""
-    return Message.from_json(json_str)
+# Route decoded payloads to the appropriate message class
+_MESSAGE_CLASSES: dict[MessageType, type[Message]] = {
+    MessageType.SUBSCRIBE: SubscribeMessage,
+    MessageType.UNSUBSCRIBE: UnsubscribeMessage,
+    MessageType.SET: SetMessage,
+    MessageType.OVERRIDE: OverrideMessage,
+    MessageType.CLEAR_OVERRIDE: ClearOverrideMessage,
+    MessageType.CONNECTED: ConnectedMessage,
+    MessageType.VALUE: ValueMessage,
+    MessageType.VALUES: ValueBatchMessage,
+    MessageType.INVALIDATED: InvalidatedMessage,
+    MessageType.ERROR: ErrorMessage,
+    MessageType.SCHEMA: SchemaMessage,
+}
+
+# Same table keyed by the wire string, so decoding skips the Enum lookup
+_MESSAGE_CLASSES_BY_NAME: dict[str, type[Message]] = {
+    msg_type.value: msg_cls for msg_type, msg_cls in _MESSAGE_CLASSES.items()
+}
+
+
+def _from_payload(data: dict[str, Any]) -> Message:
+    """Build a message from a freshly decoded payload (consumes its "type" key)."""
+    type_name = data.pop("type", None)
+    msg_cls = _MESSAGE_CLASSES_BY_NAME.get(type_name)
+    if msg_cls is None:
+        raise ValueError(f"Unknown message type: {type_name}")
+    return msg_cls(**data)
+
+
+def parse_message(data: Union[str, bytes]) -> Message:
+    """
+    Parse a WebSocket payload into a Message object.
+
+    Text frames (str) are decoded as JSON; binary frames (bytes) as MessagePack.
+    """
+    if isinstance(data, (bytes, bytearray)):
+        return Message.from_bytes(data)
+    return Message.from_json(data)
 
 
 def create_value_message(node_path: str, value: Any, format_spec: Optional[str] = None) -> ValueMessage:
@@ -2,9 +2,10 @@
 
 import asyncio
 import json
+import logging
 import os
 from pathlib import Path
-from typing import Any, Optional, Callable
+from typing import Any, Optional, Callable, Union
 import weakref
 
 import dag
@@ -17,6 +18,7 @@ except ImportError:
     web = None
 
 from .protocol import (
+    HAS_MSGPACK,
     Message,
     MessageType,
     SubscribeMessage,
@@ -26,6 +28,7 @@ from .protocol import (
     ClearOverrideMessage,
     ConnectedMessage,
     ValueMessage,
+    ValueBatchMessage,
     InvalidatedMessage,
     ErrorMessage,
     SchemaMessage,
@@ -33,6 +36,8 @@ from .protocol import (
 )
 from .session import Session, SessionManager
 
+logger = logging.getLogger(__name__)
+
 
 class LatticeUIServer:
     """
@@ -139,31 +144,35 @@ class LatticeUIServer:
         # Set up invalidation callback
         async def on_invalidation(node_paths: set[str]):
             if not ws.closed:
+                batch = ValueBatchMessage()
                 for path in node_paths:
                     try:
                         value, formatted = session.get_value(path)
-                        msg = ValueMessage(node_path=path, value=value, formatted=formatted)
-                        await ws.send_str(msg.to_json())
+                        batch.add(path, value, formatted)
                     except Exception as e:
                         err_msg = ErrorMessage(error=str(e), node_path=path)
-                        await ws.send_str(err_msg.to_json())
+                        await self._send(session, ws, err_msg)
+                if batch.items:
+                    await self._send(session, ws, batch)
 
         # Store reference to prevent garbage collection
         session._on_invalidation = lambda paths: asyncio.create_task(on_invalidation(paths))
 
         # Send connected message
         connected = ConnectedMessage(session_id=session.session_id)
-        await ws.send_str(connected.to_json())
+        await self._send(session, ws, connected)
 
         # Send schema for registered models
         schema = self._build_schema()
         schema_msg = SchemaMessage(models=schema)
-        await ws.send_str(schema_msg.to_json())
+        await self._send(session, ws, schema_msg)
 
         try:
             async for msg in ws:
                 if msg.type == web.WSMsgType.TEXT:
                     await self._handle_message(session, ws, msg.data)
+                elif msg.type == web.WSMsgType.BINARY:
+                    await self._handle_message(session, ws, msg.data)
                 elif msg.type == web.WSMsgType.ERROR:
                     print(f"WebSocket error: {ws.exception()}")
         finally:
@@ -178,11 +187,14 @@ class LatticeUIServer:
         self,
         session: Session,
         ws: web.WebSocketResponse,
-        data: str,
+        data: Union[str, bytes],
     ) -> None:
         """Handle an incoming WebSocket message."""
         try:
             msg = parse_message(data)
+            if HAS_MSGPACK and isinstance(data, (bytes, bytearray)):
+                # Client speaks MessagePack; reply in kind from now on
+                session.binary = True
 
             if isinstance(msg, SubscribeMessage):
                 await self._handle_subscribe(session, ws, msg)
@@ -196,11 +208,27 @@ class LatticeUIServer:
                 await self._handle_clear_override(session, ws, msg)
             else:
                 err = ErrorMessage(error=f"Unknown message type: {msg.type}")
-                await ws.send_str(err.to_json())
+                await self._send(session, ws, err)
 
         except Exception as e:
             err = ErrorMessage(error=str(e))
-            await ws.send_str(err.to_json())
+            await self._send(session, ws, err)
+
+    @staticmethod
+    async def _send(session: Session, ws: web.WebSocketResponse, msg: Message) -> None:
+        """Send a message using the session's negotiated wire format.
+
+        Falls back to JSON text if the message cannot be packed as MessagePack.
+        """
+        if session.binary and HAS_MSGPACK:
+            try:
+                payload = msg.to_bytes()
+            except (TypeError, ValueError) as e:
+                logger.warning("Sending %s as JSON, MessagePack failed: %s", msg.type.value, e)
+            else:
+                await ws.send_bytes(payload)
+                return
+        await ws.send_str(msg.to_json())
 
     async def _handle_subscribe(
         self,
@@ -217,11 +245,11 @@ class LatticeUIServer:
                 # Send current value
                 value, formatted = session.get_value(node_path)
                 value_msg = ValueMessage(node_path=node_path, value=value, formatted=formatted)
-                await ws.send_str(value_msg.to_json())
+                await self._send(session, ws, value_msg)
 
             except Exception as e:
                 err = ErrorMessage(error=str(e), node_path=node_path)
-                await ws.send_str(err.to_json())
+                await self._send(session, ws, err)
 
     async def _handle_unsubscribe(self, session: Session, msg: UnsubscribeMessage) -> None:
         """Handle unsubscribe message."""
@@ -247,7 +275,7 @@ class LatticeUIServer:
 
         except Exception as e:
             err = ErrorMessage(error=str(e), node_path=msg.node_path)
-            await ws.send_str(err.to_json())
+            await self._send(session, ws, err)
 
     async def _handle_override(
         self,
@@ -268,7 +296,7 @@ class LatticeUIServer:
 
         except Exception as e:
             err = ErrorMessage(error=str(e), node_path=msg.node_path)
-            await ws.send_str(err.to_json())
+            await self._send(session, ws, err)
 
     async def _handle_clear_override(
         self,
@@ -286,7 +314,7 @@ class LatticeUIServer:
 
         except Exception as e:
             err = ErrorMessage(error=str(e), node_path=msg.node_path)
-            await ws.send_str(err.to_json())
+            await self._send(session, ws, err)
 
     async def _broadcast_updates(self) -> None:
         """Broadcast value updates to all connected sessions."""
@@ -295,14 +323,17 @@ class LatticeUIServer:
             if ws is None or ws.closed:
                 continue
 
-            # Get all current values for subscribed nodes
-            values = session.get_all_values()
-            for node_path, (value, formatted) in values.items():
-                msg = ValueMessage(node_path=node_path, value=value, formatted=formatted)
-                try:
-                    await ws.send_str(msg.to_json())
-                except Exception:
-                    pass  # Connection may have closed
+            # Send all current values for subscribed nodes in one frame
+            batch = ValueBatchMessage()
+            for node_path, (value, formatted) in session.get_all_values().items():
+                batch.add(node_path, value, formatted)
+            if not batch.items:
+                continue
+            try:
+                await self._send(session, ws, batch)
+            except Exception:
+                # Connection may have closed
+                logger.exception("Failed to send updates to session %s", session.session_id)
 
     def _build_schema(self) -> dict[str, dict]:
         """Build schema for all registered models."""
@@ -452,9 +483,9 @@ class LatticeUIServer:
                 schema = msg.models;
                 renderModels();
             } else if (msg.type === 'value') {
-                values[msg.node_path] = msg.formatted !== null ? msg.formatted : formatValue(msg.value);
-                rawValues[msg.node_path] = msg.value;
-                updateValue(msg.node_path);
+                applyValue(msg);
+            } else if (msg.type === 'values') {
+                msg.items.forEach(applyValue);
             } else if (msg.type === 'connected') {
                 console.log('Session:', msg.session_id);
             } else if (msg.type === 'error') {
@@ -462,6 +493,12 @@ class LatticeUIServer:
             }
         };
 
+        function applyValue(item) {
+            values[item.node_path] = item.formatted !== null ? item.formatted : formatValue(item.value);
+            rawValues[item.node_path] = item.value;
+            updateValue(item.node_path);
+        }
+
         function formatValue(v) {
             if (v === null || v === undefined) return '-';
             if (typeof v === 'number') return v.toFixed(4);
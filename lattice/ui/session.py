@@ -2,11 +2,24 @@
 
 from dataclasses import dataclass, field
 from typing import Any, Callable, Optional
-from weakref import WeakSet
-import uuid
+from weakref import WeakValueDictionary
+import functools
+import os
+import sys
 import dag
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_format(format_spec: str) -> Callable[[Any], str]:
+    """Return a formatter for a display format spec (see Session._format_value)."""
+    if format_spec == "%":
+        return lambda value: f"{value * 100:.2f}%"
+    if format_spec.startswith("$"):
+        spec = format_spec[1:]
+        return lambda value: "$" + format(value, spec)
+    return lambda value: format(value, format_spec)
+
+
 @dataclass
 class NodeSubscription:
     """Tracks a subscription to a dag node."""
@@ -30,15 +43,18 @@ class Session:
     - A unique session ID
     - Set of subscribed node paths
     - Optional scenario for isolated overrides
+    - The wire format (JSON text or MessagePack binary) the client speaks
     """
 
     def __init__(self, session_id: Optional[str] = None):
         """Create a new session."""
-        self.session_id = session_id or str(uuid.uuid4())[:8]
+        self.session_id = session_id or os.urandom(4).hex()
         self._subscriptions: dict[str, NodeSubscription] = {}
         self._scenario: Optional[dag.Scenario] = None
         self._pending_invalidations: set[str] = set()
         self._on_invalidation: Optional[Callable[[set[str]], None]] = None
+        # True once the client has sent a binary (MessagePack) frame
+        self.binary = False
 
     def subscribe(
         self,
@@ -59,6 +75,8 @@ class Session:
         if node_path in self._subscriptions:
             return  # Already subscribed
 
+        # Paths are long-lived dict keys compared on every lookup and broadcast
+        node_path = sys.intern(node_path)
         sub = NodeSubscription(
             node_path=node_path,
             computed_func=computed_func,
@@ -81,8 +99,14 @@ class Session:
 
     def unsubscribe(self, node_path: str) -> None:
         """Unsubscribe from a node."""
-        if node_path in self._subscriptions:
-            del self._subscriptions[node_path]
+        self._subscriptions.pop(node_path, None)
+
+    def _subscription(self, node_path: str) -> NodeSubscription:
+        """Look up a subscription, raising KeyError if not subscribed."""
+        sub = self._subscriptions.get(node_path)
+        if sub is None:
+            raise KeyError(f"Not subscribed to {node_path}")
+        return sub
 
     def get_value(self, node_path: str) -> tuple[Any, Optional[str]]:
         """
@@ -91,10 +115,7 @@ class Session:
         Returns:
             Tuple of (value, formatted_string)
         """
-        if node_path not in self._subscriptions:
-            raise KeyError(f"Not subscribed to {node_path}")
-
-        sub = self._subscriptions[node_path]
+        sub = self._subscription(node_path)
         value = sub.get_value()
         formatted = self._format_value(value, sub.format_spec)
         return value, formatted
@@ -102,9 +123,10 @@ class Session:
     def get_all_values(self) -> dict[str, tuple[Any, Optional[str]]]:
         """Get current values for all subscribed nodes."""
         result = {}
-        for node_path in self._subscriptions:
+        for node_path, sub in self._subscriptions.items():
             try:
-                result[node_path] = self.get_value(node_path)
+                value = sub.get_value()
+                result[node_path] = (value, self._format_value(value, sub.format_spec))
             except Exception as e:
                 result[node_path] = (None, f"Error: {e}")
         return result
@@ -117,10 +139,7 @@ class Session:
             node_path: Path to the node
             value: New value to set
         """
-        if node_path not in self._subscriptions:
-            raise KeyError(f"Not subscribed to {node_path}")
-
-        sub = self._subscriptions[node_path]
+        sub = self._subscription(node_path)
         sub.computed_func.set(value)
 
     def override_value(self, node_path: str, value: Any) -> None:
@@ -131,18 +150,12 @@ class Session:
             node_path: Path to the node
             value: Value to override with
         """
-        if node_path not in self._subscriptions:
-            raise KeyError(f"Not subscribed to {node_path}")
-
-        sub = self._subscriptions[node_path]
+        sub = self._subscription(node_path)
         sub.computed_func.override(value)
 
     def clear_override(self, node_path: str) -> None:
         """Clear an override on a node."""
-        if node_path not in self._subscriptions:
-            raise KeyError(f"Not subscribed to {node_path}")
-
-        sub = self._subscriptions[node_path]
+        sub = self._subscription(node_path)
         sub.computed_func.clear_override()
 
     def flush_invalidations(self) -> set[str]:
@@ -163,12 +176,7 @@ class Session:
             return None
 
         try:
-            if format_spec == "%":
-                return f"{value * 100:.2f}%"
-            elif format_spec.startswith("$"):
-                return f"${value:{format_spec[1:]}}"
-            else:
-                return f"{value:{format_spec}}"
+            return _compile_format(format_spec)(value)
         except (ValueError, TypeError):
             return str(value)
 
@@ -186,11 +194,15 @@ class SessionManager:
     - Session creation and cleanup
     - Lookup by session ID
     - Broadcasting to all sessions
+
+    Sessions are held weakly: the owner of a session (e.g. the server's
+    connection handler) keeps it alive, and a session whose connection is
+    dropped without remove_session() is discarded once unreferenced.
     """
 
     def __init__(self):
         """Create a new session manager."""
-        self._sessions: dict[str, Session] = {}
+        self._sessions: WeakValueDictionary[str, Session] = WeakValueDictionary()
 
     def create_session(self, session_id: Optional[str] = None) -> Session:
         """
@@ -212,8 +224,7 @@ class SessionManager:
 
     def remove_session(self, session_id: str) -> None:
         """Remove a session."""
-        if session_id in self._sessions:
-            del self._sessions[session_id]
+        self._sessions.pop(session_id, None)
 
     def get_all_sessions(self) -> list[Session]:
         """Get all active sessions."""
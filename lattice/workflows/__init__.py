@@ -27,11 +27,13 @@ Key Functions:
 
 Workflows:
     ComputeGreeksWorkflow: Fan-out/fan-in Greeks calculation
+    ComputePortfolioGreeksWorkflow: Greeks calculation in batched activities
     StressTestWorkflow: Fan-out/fan-in stress testing
     BatchRiskWorkflow: Combined risk workflow
 
 Activities:
     compute_instrument_greeks: Calculate Greeks for one instrument
+    compute_portfolio_greeks: Calculate Greeks for a batch of instruments
     compute_stress_test: Calculate stress impact for one instrument
 
 Data Classes:
@@ -41,6 +43,9 @@ Data Classes:
 Worker:
     run_worker: Start a worker process
     create_worker: Create a configured worker instance
+
+Data Conversion:
+    create_data_converter: Temporal data converter (orjson-backed when installed)
 """
 
 from .activities import (
@@ -49,11 +54,13 @@ from .activities import (
     serialize_instrument,
     deserialize_instrument,
     compute_instrument_greeks,
+    compute_portfolio_greeks,
     compute_stress_test,
 )
 
 from .workflows import (
     ComputeGreeksWorkflow,
+    ComputePortfolioGreeksWorkflow,
     StressTestWorkflow,
     BatchRiskWorkflow,
 )
@@ -65,6 +72,8 @@ from .worker import (
     DEFAULT_TEMPORAL_HOST,
 )
 
+from .converter import create_data_converter
+
 from .client import (
     compute_greeks_async,
     stress_test_async,
@@ -81,9 +90,11 @@ __all__ = [
     "deserialize_instrument",
     # Activities
     "compute_instrument_greeks",
+    "compute_portfolio_greeks",
     "compute_stress_test",
     # Workflows
     "ComputeGreeksWorkflow",
+    "ComputePortfolioGreeksWorkflow",
     "StressTestWorkflow",
     "BatchRiskWorkflow",
     # Worker
@@ -96,4 +107,6 @@ __all__ = [
     "stress_test_async",
     "batch_risk_async",
     "LatticeTemporalClient",
+    # Data conversion
+    "create_data_converter",
 ]
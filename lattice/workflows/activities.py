@@ -16,16 +16,21 @@ Example:
     )
 """
 
+import asyncio
+import functools
+import importlib
 import logging
-from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, Type
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Optional, Tuple, Type
 
 import dag
 from dag.flags import Flags
+from lattice._compat import SLOTS
 from lattice.risk.shocks import shocked_value
 
 logger = logging.getLogger(__name__)
 
+
 try:
     from temporalio import activity
 
@@ -43,7 +48,7 @@ except ImportError:
     activity = _MockActivity()
 
 
-@dataclass
+@dataclass(**SLOTS)
 class InstrumentRef:
     """Reference to an instrument for passing to activities.
 
@@ -64,6 +69,18 @@ class InstrumentRef:
     serialized_state: Optional[Dict[str, Any]] = None
     type_name: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict for workflow arguments.
+
+        Unlike dataclasses.asdict(), serialized_state is not deep-copied;
+        it is shared with the ref and must be treated as read-only.
+        """
+        return {
+            "store_path": self.store_path,
+            "serialized_state": self.serialized_state,
+            "type_name": self.type_name,
+        }
+
 
 @dataclass
 class GreeksResult:
@@ -93,6 +110,16 @@ class GreeksResult:
     error: Optional[str] = None
 
 
+@functools.lru_cache(maxsize=256)
+def _input_fields(cls: type) -> Tuple[str, ...]:
+    """Get the names of an instrument class's Input fields (cached per class)."""
+    return tuple(
+        name
+        for name, descriptor in cls._computed_functions_.items()
+        if descriptor.flags & Flags.Input
+    )
+
+
 def serialize_instrument(inst: dag.Model) -> Dict[str, Any]:
     """Serialize a dag.Model instrument to a dictionary.
 
@@ -106,22 +133,35 @@ def serialize_instrument(inst: dag.Model) -> Dict[str, Any]:
         Dict with type name and field values
     """
     data = {}
-    for name, descriptor in inst._computed_functions_.items():
-        if descriptor.flags & Flags.Input:
-            accessor = getattr(inst, name)
-            try:
-                value = accessor()
-                if isinstance(value, (str, int, float, bool, type(None))):
-                    data[name] = value
-                elif isinstance(value, (list, tuple)):
-                    data[name] = list(value)
-                elif isinstance(value, dict):
-                    data[name] = dict(value)
-            except Exception as e:
-                logger.warning("Skipping field %s during serialization: %s", name, e)
+    for name in _input_fields(type(inst)):
+        accessor = getattr(inst, name)
+        try:
+            value = accessor()
+            if isinstance(value, (str, int, float, bool, type(None))):
+                data[name] = value
+            elif isinstance(value, (list, tuple)):
+                data[name] = list(value)
+            elif isinstance(value, dict):
+                data[name] = dict(value)
+        except Exception as e:
+            logger.warning("Skipping field %s during serialization: %s", name, e)
     return data
 
 
+@functools.lru_cache(maxsize=256)
+def _resolve_type(type_name: str) -> type:
+    """Import a class from its fully qualified name (cached per name).
+
+    Raises:
+        ImportError: If the name is not qualified or the module is missing
+        AttributeError: If the module has no such class
+    """
+    module_name, _, class_name = type_name.rpartition(".")
+    if not module_name:
+        raise ImportError(f"Cannot import type: {type_name}")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
 def deserialize_instrument(
     type_name: str,
     data: Dict[str, Any],
@@ -144,22 +184,14 @@ def deserialize_instrument(
         ImportError: If the class cannot be imported
         AttributeError: If a field doesn't exist
     """
-    parts = type_name.rsplit(".", 1)
-    if len(parts) == 2:
-        module_name, class_name = parts
-        import importlib
-
-        module = importlib.import_module(module_name)
-        cls = getattr(module, class_name)
-    else:
-        raise ImportError(f"Cannot import type: {type_name}")
-
+    cls = _resolve_type(type_name)
     inst = cls()
+    # Check names against the cached Input fields rather than probing
+    # each attribute; keys that are not Input fields are ignored.
+    fields = _input_fields(cls)
     for name, value in data.items():
-        if hasattr(inst, name):
-            accessor = getattr(inst, name)
-            if hasattr(accessor, "set"):
-                accessor.set(value)
+        if name in fields:
+            getattr(inst, name).set(value)
 
     return inst
 
@@ -194,44 +226,28 @@ def _load_instrument(
         )
 
 
-@activity.defn
-async def compute_instrument_greeks(
-    instrument_name: str,
-    instrument_ref: InstrumentRef,
-    bump: float = 0.01,
-    store_uri: Optional[str] = None,
-) -> GreeksResult:
-    """Compute all applicable Greeks for a single instrument.
+def _ref_key(ref: InstrumentRef) -> Optional[tuple]:
+    """Hashable identity of a ref, or None if its state is not hashable."""
+    state = ref.serialized_state
+    try:
+        return (ref.store_path, ref.type_name, frozenset(state.items()) if state else None)
+    except TypeError:
+        return None
 
-    This activity loads an instrument from a reference and computes
-    all Greeks that apply based on the instrument's available inputs.
 
-    Supported Greeks:
-    - Delta/Gamma: If instrument has Spot and Price
-    - Vega: If instrument has Volatility and Price
-    - Theta: If instrument has TimeToExpiry and Price
-    - Rho: If instrument has Rate and Price
-    - DV01: If instrument has YieldToMaturity and Price
+def _compute_greeks(result: GreeksResult, inst: dag.Model, bump: float) -> GreeksResult:
+    """Fill in every Greek that applies to a loaded instrument.
 
     Args:
-        instrument_name: Identifier for results tracking
-        instrument_ref: Reference to the instrument
+        result: Result to populate (errors keep the first failure)
+        inst: The loaded instrument
         bump: Bump size for numerical differentiation
-        store_uri: Store connection string (if using store paths)
 
     Returns:
-        GreeksResult with all computed values
+        The populated result
     """
     from lattice.risk.sensitivities import delta, gamma, vega, theta, rho, dv01
 
-    result = GreeksResult(instrument_name=instrument_name)
-
-    try:
-        inst = _load_instrument(instrument_ref, store_uri)
-    except Exception as e:
-        result.error = f"Failed to load instrument: {e}"
-        return result
-
     if hasattr(inst, "Spot") and hasattr(inst, "Price"):
         try:
             result.delta = delta(inst, bump)
@@ -276,6 +292,94 @@ async def compute_instrument_greeks(
     return result
 
 
+@activity.defn
+async def compute_instrument_greeks(
+    instrument_name: str,
+    instrument_ref: InstrumentRef,
+    bump: float = 0.01,
+    store_uri: Optional[str] = None,
+) -> GreeksResult:
+    """Compute all applicable Greeks for a single instrument.
+
+    This activity loads an instrument from a reference and computes
+    all Greeks that apply based on the instrument's available inputs.
+
+    Supported Greeks:
+    - Delta/Gamma: If instrument has Spot and Price
+    - Vega: If instrument has Volatility and Price
+    - Theta: If instrument has TimeToExpiry and Price
+    - Rho: If instrument has Rate and Price
+    - DV01: If instrument has YieldToMaturity and Price
+
+    Args:
+        instrument_name: Identifier for results tracking
+        instrument_ref: Reference to the instrument
+        bump: Bump size for numerical differentiation
+        store_uri: Store connection string (if using store paths)
+
+    Returns:
+        GreeksResult with all computed values
+    """
+    result = GreeksResult(instrument_name=instrument_name)
+
+    try:
+        inst = _load_instrument(instrument_ref, store_uri)
+    except Exception as e:
+        result.error = f"Failed to load instrument: {e}"
+        return result
+
+    return _compute_greeks(result, inst, bump)
+
+
+@activity.defn
+async def compute_portfolio_greeks(
+    instruments: Dict[str, InstrumentRef],
+    bump: float = 0.01,
+    store_uri: Optional[str] = None,
+) -> Dict[str, GreeksResult]:
+    """Compute Greeks for a batch of instruments in one activity.
+
+    Same calculation as compute_instrument_greeks, but a whole batch costs
+    a single activity dispatch (one task, one payload round trip) instead
+    of one per instrument. Failures are reported per instrument, and
+    identical refs within the batch (e.g. the same contract held in
+    several books) are computed once.
+
+    The calculation is synchronous, so the activity yields to the worker's
+    event loop after each instrument; batches on the same worker interleave
+    rather than run in parallel, and heartbeats and other activities are
+    not starved. It stays on the event loop thread because dag scenarios
+    are single-threaded.
+
+    Args:
+        instruments: Map of instrument name to reference
+        bump: Bump size for numerical differentiation
+        store_uri: Store connection string (if using store paths)
+
+    Returns:
+        Dict mapping instrument name to its GreeksResult
+    """
+    results = {}
+    computed: Dict[tuple, GreeksResult] = {}
+    for name, ref in instruments.items():
+        key = _ref_key(ref)
+        if key is not None and key in computed:
+            results[name] = replace(computed[key], instrument_name=name)
+            continue
+        result = GreeksResult(instrument_name=name)
+        try:
+            inst = _load_instrument(ref, store_uri)
+        except Exception as e:
+            result.error = f"Failed to load instrument: {e}"
+        else:
+            _compute_greeks(result, inst, bump)
+        if key is not None:
+            computed[key] = result
+        results[name] = result
+        await asyncio.sleep(0)
+    return results
+
+
 @activity.defn
 async def compute_stress_test(
     instrument_name: str,
@@ -19,7 +19,6 @@ Example:
     results = asyncio.run(compute_greeks_async(options))
 """
 
-from dataclasses import asdict
 from typing import Any, Dict, Optional
 from uuid import uuid4
 
@@ -34,6 +33,7 @@ except ImportError:
 import dag
 
 from .activities import InstrumentRef, GreeksResult, serialize_instrument
+from .converter import create_data_converter
 from .workflows import ComputeGreeksWorkflow, StressTestWorkflow, BatchRiskWorkflow
 from .worker import DEFAULT_TASK_QUEUE, DEFAULT_TEMPORAL_HOST
 
@@ -114,9 +114,11 @@ async def compute_greeks_async(
         print(results["OPT_1"]["delta"])
     """
     _check_temporalio()
-    client = await Client.connect(temporal_host, namespace=namespace)
+    client = await Client.connect(
+        temporal_host, namespace=namespace, data_converter=create_data_converter()
+    )
 
-    refs = {name: asdict(_instrument_to_ref(inst)) for name, inst in instruments.items()}
+    refs = {name: _instrument_to_ref(inst).to_dict() for name, inst in instruments.items()}
 
     if workflow_id is None:
         workflow_id = f"compute-greeks-{uuid4()}"
@@ -165,9 +167,11 @@ async def stress_test_async(
         print(results["OPT_1"]["price_impact"])
     """
     _check_temporalio()
-    client = await Client.connect(temporal_host, namespace=namespace)
+    client = await Client.connect(
+        temporal_host, namespace=namespace, data_converter=create_data_converter()
+    )
 
-    refs = {name: asdict(_instrument_to_ref(inst)) for name, inst in instruments.items()}
+    refs = {name: _instrument_to_ref(inst).to_dict() for name, inst in instruments.items()}
 
     if workflow_id is None:
         workflow_id = f"stress-test-{uuid4()}"
@@ -211,9 +215,11 @@ async def batch_risk_async(
         RuntimeError: If temporalio is not installed
     """
     _check_temporalio()
-    client = await Client.connect(temporal_host, namespace=namespace)
+    client = await Client.connect(
+        temporal_host, namespace=namespace, data_converter=create_data_converter()
+    )
 
-    refs = {name: asdict(_instrument_to_ref(inst)) for name, inst in instruments.items()}
+    refs = {name: _instrument_to_ref(inst).to_dict() for name, inst in instruments.items()}
 
     if workflow_id is None:
         workflow_id = f"batch-risk-{uuid4()}"
@@ -253,7 +259,11 @@ class LatticeTemporalClient:
         self._client: Optional[Client] = None
 
     async def __aenter__(self) -> "LatticeTemporalClient":
-        self._client = await Client.connect(self.temporal_host, namespace=self.namespace)
+        self._client = await Client.connect(
+            self.temporal_host,
+            namespace=self.namespace,
+            data_converter=create_data_converter(),
+        )
         return self
 
     async def __aexit__(self, *args) -> None:
@@ -264,7 +274,9 @@ class LatticeTemporalClient:
         _check_temporalio()
         if self._client is None:
             self._client = await Client.connect(
-                self.temporal_host, namespace=self.namespace
+                self.temporal_host,
+                namespace=self.namespace,
+                data_converter=create_data_converter(),
             )
 
     async def compute_greeks(
@@ -279,7 +291,7 @@ class LatticeTemporalClient:
             await self.connect()
 
         refs = {
-            name: asdict(_instrument_to_ref(inst)) for name, inst in instruments.items()
+            name: _instrument_to_ref(inst).to_dict() for name, inst in instruments.items()
         }
 
         if workflow_id is None:
@@ -304,7 +316,7 @@ class LatticeTemporalClient:
             await self.connect()
 
         refs = {
-            name: asdict(_instrument_to_ref(inst)) for name, inst in instruments.items()
+            name: _instrument_to_ref(inst).to_dict() for name, inst in instruments.items()
         }
 
         if workflow_id is None:
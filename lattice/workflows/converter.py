@@ -0,0 +1,95 @@
+"""Temporal data converter for Lattice workflows.
+
+Workflow arguments and results (instrument refs with their serialized
+state, Greeks results) are JSON payloads. When orjson is installed, the
+converter returned by create_data_converter() encodes and decodes them
+with orjson instead of the stdlib json module. Payloads keep the standard
+"json/plain" encoding, so clients and workers with or without orjson
+interoperate.
+
+Example:
+    from temporalio.client import Client
+    from lattice.workflows.converter import create_data_converter
+
+    client = await Client.connect(
+        "localhost:7233", data_converter=create_data_converter()
+    )
+"""
+
+import dataclasses
+from typing import Any, Optional, Type
+
+from lattice._json import HAS_ORJSON, loads, orjson_dumps
+
+try:
+    from temporalio.api.common.v1 import Payload
+    from temporalio.converter import (
+        CompositePayloadConverter,
+        DataConverter,
+        DefaultPayloadConverter,
+        JSONPlainPayloadConverter,
+        value_to_type,
+    )
+
+    TEMPORALIO_AVAILABLE = True
+except ImportError:
+    TEMPORALIO_AVAILABLE = False
+    Payload = None
+    DataConverter = None
+
+
+if TEMPORALIO_AVAILABLE:
+
+    class OrjsonPlainPayloadConverter(JSONPlainPayloadConverter):
+        """JSON payload converter that uses orjson for encoding and decoding.
+
+        Values orjson cannot encode (e.g. integers beyond 64 bits) and values
+        holding NaN or infinity, which orjson would write as null, fall back
+        to the stdlib-based converter.
+        """
+
+        def to_payload(self, value: Any) -> Optional[Payload]:
+            data = orjson_dumps(value)
+            if data is None:
+                return super().to_payload(value)
+            return Payload(metadata={"encoding": self.encoding.encode()}, data=data)
+
+        def from_payload(self, payload: Payload, type_hint: Optional[Type] = None) -> Any:
+            obj = loads(payload.data)
+            if type_hint:
+                obj = value_to_type(type_hint, obj)
+            return obj
+
+    class OrjsonPayloadConverter(CompositePayloadConverter):
+        """Default Temporal payload converter with orjson for JSON payloads."""
+
+        def __init__(self) -> None:
+            super().__init__(
+                *(
+                    OrjsonPlainPayloadConverter()
+                    if isinstance(converter, JSONPlainPayloadConverter)
+                    else converter
+                    for converter in DefaultPayloadConverter.default_encoding_payload_converters
+                )
+            )
+
+
+def create_data_converter() -> "DataConverter":
+    """Create the data converter used by Lattice clients and workers.
+
+    Returns:
+        A DataConverter using orjson for JSON payloads when orjson is
+        installed, otherwise Temporal's default converter.
+
+    Raises:
+        RuntimeError: If temporalio is not installed
+    """
+    if not TEMPORALIO_AVAILABLE:
+        raise RuntimeError(
+            "temporalio is not installed. Install with: pip install lattice[temporal]"
+        )
+    if not HAS_ORJSON:
+        return DataConverter.default
+    return dataclasses.replace(
+        DataConverter.default, payload_converter_class=OrjsonPayloadConverter
+    )
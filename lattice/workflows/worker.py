@@ -23,7 +23,7 @@ from typing import Optional
 
 try:
     from temporalio.client import Client
-    from temporalio.worker import Worker
+    from temporalio.worker import Worker, WorkflowRunner
     from temporalio.worker.workflow_sandbox import (
         SandboxedWorkflowRunner,
         SandboxRestrictions,
@@ -34,11 +34,22 @@ except ImportError:
     TEMPORALIO_AVAILABLE = False
     Client = None
     Worker = None
+    WorkflowRunner = None
     SandboxedWorkflowRunner = None
     SandboxRestrictions = None
 
-from .activities import compute_instrument_greeks, compute_stress_test
-from .workflows import ComputeGreeksWorkflow, StressTestWorkflow, BatchRiskWorkflow
+from .activities import (
+    compute_instrument_greeks,
+    compute_portfolio_greeks,
+    compute_stress_test,
+)
+from .converter import create_data_converter
+from .workflows import (
+    ComputeGreeksWorkflow,
+    ComputePortfolioGreeksWorkflow,
+    StressTestWorkflow,
+    BatchRiskWorkflow,
+)
 
 
 DEFAULT_TASK_QUEUE = "lattice-risk"
@@ -48,12 +59,15 @@ DEFAULT_TEMPORAL_HOST = "localhost:7233"
 async def create_worker(
     client: "Client",
     task_queue: str = DEFAULT_TASK_QUEUE,
+    workflow_runner: Optional["WorkflowRunner"] = None,
 ) -> "Worker":
     """Create a Temporal worker configured for Lattice workflows.
 
     Args:
         client: Connected Temporal client
         task_queue: Task queue name to listen on
+        workflow_runner: Runner for workflow code. Defaults to the sandboxed
+            runner with numpy, dag, lattice and livetable passed through.
 
     Returns:
         Configured Worker instance (not yet running)
@@ -71,14 +85,17 @@ async def create_worker(
         task_queue=task_queue,
         workflows=[
             ComputeGreeksWorkflow,
+            ComputePortfolioGreeksWorkflow,
             StressTestWorkflow,
             BatchRiskWorkflow,
         ],
         activities=[
             compute_instrument_greeks,
+            compute_portfolio_greeks,
             compute_stress_test,
         ],
-        workflow_runner=SandboxedWorkflowRunner(
+        workflow_runner=workflow_runner
+        or SandboxedWorkflowRunner(
             restrictions=SandboxRestrictions.default.with_passthrough_modules(
                 "numpy", "dag", "lattice", "livetable"
             )
@@ -122,7 +139,9 @@ async def run_worker(
         f"Connecting to Temporal at {temporal_host}, namespace={namespace}"
     )
 
-    client = await Client.connect(temporal_host, namespace=namespace)
+    client = await Client.connect(
+        temporal_host, namespace=namespace, data_converter=create_data_converter()
+    )
 
     logging.info(f"Starting worker on task queue: {task_queue}")
 
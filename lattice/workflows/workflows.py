@@ -37,6 +37,7 @@ from .activities import (
     InstrumentRef,
     GreeksResult,
     compute_instrument_greeks,
+    compute_portfolio_greeks,
     compute_stress_test,
 )
 
@@ -143,6 +144,97 @@ class ComputeGreeksWorkflow:
         return output
 
 
+@_workflow_defn
+class ComputePortfolioGreeksWorkflow:
+    """Workflow to compute Greeks for a portfolio in batched activities.
+
+    Produces the same output as ComputeGreeksWorkflow, but groups
+    instruments into batches of batch_size and runs one activity per batch.
+    Large portfolios then pay one activity dispatch and payload round trip
+    per batch rather than per instrument. Batches are dispatched together
+    and run in parallel across workers; batches picked up by the same
+    worker share its event loop and interleave instrument by instrument.
+
+    Example:
+        result = await client.execute_workflow(
+            ComputePortfolioGreeksWorkflow.run,
+            args=[instruments, 0.01, "sqlite:///trading.db", 50],
+            id="portfolio-greeks-001",
+            task_queue="lattice-risk",
+        )
+    """
+
+    @_workflow_run
+    async def run(
+        self,
+        instruments: Dict[str, Dict[str, Any]],
+        bump: float = 0.01,
+        store_uri: Optional[str] = None,
+        batch_size: int = 50,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Execute the batched Greeks calculation workflow.
+
+        Args:
+            instruments: Map of instrument name to InstrumentRef as dict
+            bump: Bump size for numerical differentiation
+            store_uri: Store connection string if using persistence
+            batch_size: Maximum number of instruments per activity
+
+        Returns:
+            Dict mapping instrument name to GreeksResult as dict
+        """
+        if not TEMPORALIO_AVAILABLE:
+            raise RuntimeError(
+                "temporalio is not installed. Install with: pip install lattice[temporal]"
+            )
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
+        retry_policy = RetryPolicy(
+            initial_interval=timedelta(seconds=1),
+            maximum_interval=timedelta(seconds=30),
+            maximum_attempts=3,
+            non_retryable_error_types=["ValueError"],
+        )
+
+        items = [
+            (name, InstrumentRef(**ref_dict) if isinstance(ref_dict, dict) else ref_dict)
+            for name, ref_dict in instruments.items()
+        ]
+        batches = [
+            dict(items[start : start + batch_size])
+            for start in range(0, len(items), batch_size)
+        ]
+
+        tasks = [
+            workflow.execute_activity(
+                compute_portfolio_greeks,
+                args=[batch, bump, store_uri],
+                start_to_close_timeout=timedelta(minutes=5),
+                retry_policy=retry_policy,
+            )
+            for batch in batches
+        ]
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        output = {}
+        for batch, batch_result in zip(batches, results):
+            if isinstance(batch_result, Exception):
+                for name in batch:
+                    output[name] = {"instrument_name": name, "error": str(batch_result)}
+                continue
+            for name, result in batch_result.items():
+                if isinstance(result, GreeksResult):
+                    output[name] = asdict(result)
+                elif isinstance(result, dict):
+                    output[name] = result
+                else:
+                    output[name] = {"instrument_name": name, "error": "Unknown result type"}
+
+        return output
+
+
 @_workflow_defn
 class StressTestWorkflow:
     """Workflow to run stress tests across multiple instruments.
@@ -1,7 +1,5 @@
 """Tests for the lattice.store module."""
 
-import os
-import tempfile
 import pytest
 import dag
 
@@ -27,6 +25,26 @@ def reset_dag():
     dag.reset()
 
 
+@pytest.fixture(scope="module")
+def _shared_memory_store():
+    """In-memory store with the standard types registered, shared per module."""
+    store = connect("memory://")
+    store.register_type("/Instruments/*", VanillaOption)
+    store.register_type("/Stocks/*", Stock)
+    store.register_type("/Bonds/*", Bond)
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def memory_store(_shared_memory_store):
+    """In-memory store, emptied before each test."""
+    store = _shared_memory_store
+    store._backend.connect()  # MemoryBackend.connect() starts with no data
+    store.clear_cache()
+    return store
+
+
 class TestTypeRegistry:
     """Tests for TypeRegistry."""
 
@@ -231,29 +249,43 @@ class TestSQLiteBackend:
 
         backend.close()
 
-    def test_persistence_to_file(self):
+    def test_persistence_to_file(self, tmp_path):
         """Data persists to file."""
         from lattice.store.backends.base import StoredObject
 
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            db_path = f.name
-
-        try:
-            # Write
-            backend1 = SQLiteBackend()
-            backend1.connect(path=db_path)
-            backend1.put(StoredObject("/test", "Test", {"x": 123}))
-            backend1.close()
-
-            # Read in new connection
-            backend2 = SQLiteBackend()
-            backend2.connect(path=db_path)
-            loaded = backend2.get("/test")
-            assert loaded is not None
-            assert loaded.data["x"] == 123
-            backend2.close()
-        finally:
-            os.unlink(db_path)
+        db_path = str(tmp_path / "test.db")
+
+        # Write
+        backend1 = SQLiteBackend()
+        backend1.connect(path=db_path)
+        backend1.put(StoredObject("/test", "Test", {"x": 123}))
+        backend1.close()
+
+        # Read in new connection
+        backend2 = SQLiteBackend()
+        backend2.connect(path=db_path)
+        loaded = backend2.get("/test")
+        assert loaded is not None
+        assert loaded.data["x"] == 123
+        backend2.close()
+
+    def test_non_finite_floats_round_trip(self):
+        """NaN and infinity are stored as themselves, not as null."""
+        import math
+        from lattice.store.backends.base import StoredObject
+
+        backend = SQLiteBackend()
+        backend.connect(path=":memory:")
+
+        backend.put(
+            StoredObject("/test", "Test", {"vol": float("nan"), "barrier": [float("inf")]})
+        )
+
+        loaded = backend.get("/test")
+        assert math.isnan(loaded.data["vol"])
+        assert loaded.data["barrier"] == [float("inf")]
+
+        backend.close()
 
     def test_query_glob(self):
         """Glob patterns work in SQLite."""
@@ -271,20 +303,25 @@ class TestSQLiteBackend:
 
         backend.close()
 
+    def test_get_many(self):
+        """get_many returns existing objects and skips missing paths."""
+        from lattice.store.backends.base import StoredObject
+
+        backend = SQLiteBackend()
+        backend.connect(path=":memory:")
+
+        backend.put(StoredObject("/a/1", "T", {"x": 1}))
+        backend.put(StoredObject("/a/2", "T", {"x": 2}))
+
+        loaded = backend.get_many(["/a/1", "/a/2", "/a/missing"])
+        assert {obj.path: obj.data["x"] for obj in loaded} == {"/a/1": 1, "/a/2": 2}
+
+        backend.close()
+
 
 class TestStore:
     """Tests for Store class."""
 
-    @pytest.fixture
-    def memory_store(self):
-        """Create an in-memory store."""
-        store = connect("memory://")
-        store.register_type("/Instruments/*", VanillaOption)
-        store.register_type("/Stocks/*", Stock)
-        store.register_type("/Bonds/*", Bond)
-        yield store
-        store.close()
-
     def test_store_and_retrieve(self, memory_store):
         """Can store and retrieve objects."""
         option = VanillaOption()
@@ -333,6 +370,51 @@ class TestStore:
         with pytest.raises(TypeMismatchError):
             memory_store["/Instruments/AAPL"] = stock  # Expects VanillaOption
 
+    def test_unchanged_save_skips_write(self, memory_store):
+        """Saving unchanged content keeps the stored version."""
+        option = VanillaOption()
+        option.Strike.set(100.0)
+        memory_store["/Instruments/TEST"] = option
+        memory_store["/Instruments/TEST"] = option
+        assert memory_store._backend.get("/Instruments/TEST").version == 1
+
+        option.Strike.set(105.0)
+        memory_store["/Instruments/TEST"] = option
+        assert memory_store._backend.get("/Instruments/TEST").version == 2
+
+    def test_save_picks_up_external_write(self, memory_store):
+        """A row changed behind the store's back is rewritten on save."""
+        from lattice.store.backends.base import StoredObject
+
+        option = VanillaOption()
+        option.Strike.set(100.0)
+        memory_store["/Instruments/TEST"] = option
+
+        stored = memory_store._backend.get("/Instruments/TEST")
+        memory_store._backend.put(
+            StoredObject("/Instruments/TEST", stored.type_name, {"Strike": 1.0}, version=2)
+        )
+        memory_store["/Instruments/TEST"] = option
+
+        assert memory_store._backend.get("/Instruments/TEST").data["Strike"] == 100.0
+
+    def test_mixed_key_dict(self):
+        """Dict fields with mixed key types can be stored and re-saved."""
+        class TestModel(dag.Model):
+            @dag.computed(dag.Persisted)
+            def Buckets(self) -> dict:
+                return {}
+
+        with connect("memory://") as db:
+            db.register_type("/Test/*", TestModel)
+
+            obj = TestModel()
+            obj.Buckets.set({1: "one", "two": 2})
+            db["/Test/A"] = obj
+            db["/Test/A"] = obj
+
+            assert db._backend.get("/Test/A").data["Buckets"] == {1: "one", "two": 2}
+
     def test_contains(self, memory_store):
         """Can check if path exists."""
         option = VanillaOption()
@@ -411,6 +493,24 @@ class TestStore:
         aapl_paths = list(memory_store.query("/Instruments/AAPL_*"))
         assert len(aapl_paths) == 2
 
+    def test_get_many(self, memory_store):
+        """get_many loads several objects and reuses the identity map."""
+        opt1 = VanillaOption()
+        opt1.Strike.set(150.0)
+        memory_store["/Instruments/A"] = opt1
+        memory_store["/Instruments/B"] = VanillaOption()
+        memory_store.clear_cache()
+
+        first = memory_store["/Instruments/A"]
+        loaded = memory_store.get_many(["/Instruments/A", "/Instruments/B"])
+
+        assert loaded[0] is first
+        assert loaded[0].Strike() == 150.0
+        assert loaded[1] is memory_store["/Instruments/B"]
+
+        with pytest.raises(NotFoundError):
+            memory_store.get_many(["/Instruments/A", "/Instruments/MISSING"])
+
     def test_context_manager(self):
         """Store works as context manager."""
         with connect("memory://") as db:
@@ -422,32 +522,150 @@ class TestStore:
 class TestSQLiteStore:
     """Tests for Store with SQLite backend."""
 
-    def test_sqlite_persistence(self):
+    def test_sqlite_persistence(self, tmp_path):
         """Objects persist across connections - only Persisted fields."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            db_path = f.name
+        db_path = str(tmp_path / "test.db")
+
+        # Write
+        with connect(f"sqlite:///{db_path}") as db:
+            db.register_type("/Instruments/*", VanillaOption)
+            option = VanillaOption()
+            option.Strike.set(150.0)
+            option.IsCall.set(False)
+            option.Spot.set(155.0)  # Not Persisted - won't survive reload
+            db["/Instruments/AAPL_C_150"] = option
+
+        # Read in new connection
+        with connect(f"sqlite:///{db_path}") as db:
+            db.register_type("/Instruments/*", VanillaOption)
+            loaded = db["/Instruments/AAPL_C_150"]
+            # Persisted fields preserved
+            assert loaded.Strike() == 150.0
+            assert loaded.IsCall() is False
+            # Non-Persisted field reverts to default
+            assert loaded.Spot() == 100.0  # Default, not 155.0
+
+    def test_context_manager_is_atomic(self, tmp_path):
+        """Writes inside `with store:` commit together or not at all."""
+        db_path = str(tmp_path / "test.db")
+
+        with connect(f"sqlite:///{db_path}") as db:
+            db.register_type("/Test/*", VanillaOption)
+            db["/Test/A"] = VanillaOption()
+            db["/Test/B"] = VanillaOption()
 
-        try:
-            # Write
+        with pytest.raises(ValueError):
             with connect(f"sqlite:///{db_path}") as db:
-                db.register_type("/Instruments/*", VanillaOption)
-                option = VanillaOption()
-                option.Strike.set(150.0)
-                option.IsCall.set(False)
-                option.Spot.set(155.0)  # Not Persisted - won't survive reload
-                db["/Instruments/AAPL_C_150"] = option
-
-            # Read in new connection
+                db.register_type("/Test/*", VanillaOption)
+                db["/Test/C"] = VanillaOption()
+                db["/Test/D"] = VanillaOption()
+                raise ValueError("Simulated error")
+
+        with connect(f"sqlite:///{db_path}") as db:
+            assert "/Test/A" in db
+            assert "/Test/B" in db
+            assert "/Test/C" not in db
+            assert "/Test/D" not in db
+
+    def test_concurrent_read_blocks(self, tmp_path):
+        """Read-only `with store:` blocks don't lock out a writer."""
+        db_path = str(tmp_path / "test.db")
+
+        with connect(f"sqlite:///{db_path}") as db:
+            db.register_type("/Test/*", VanillaOption)
+            db["/Test/A"] = VanillaOption()
+
+        with connect(f"sqlite:///{db_path}") as reader:
+            assert "/Test/A" in reader
+            with connect(f"sqlite:///{db_path}") as writer:
+                writer.register_type("/Test/*", VanillaOption)
+                writer["/Test/B"] = VanillaOption()
+
+        with connect(f"sqlite:///{db_path}") as db:
+            assert "/Test/B" in db
+
+    def test_exit_closes_when_commit_fails(self, tmp_path):
+        """The backend is closed even if the block's commit raises."""
+        db_path = str(tmp_path / "test.db")
+        db = connect(f"sqlite:///{db_path}")
+        db.register_type("/Test/*", VanillaOption)
+
+        def failing_commit(handle):
+            raise RuntimeError("commit failed")
+
+        db._backend.commit_transaction = failing_commit
+        with pytest.raises(RuntimeError):
+            with db:
+                db["/Test/A"] = VanillaOption()
+
+        assert db._backend._conn is None
+
+    def test_context_manager_writes_in_one_batch(self, tmp_path):
+        """Writes inside `with store:` reach SQLite in a single executemany."""
+        db_path = str(tmp_path / "test.db")
+        batches = []
+
+        class CountingConnection:
+            def __init__(self, conn):
+                self._conn = conn
+
+            def executemany(self, sql, rows):
+                rows = list(rows)
+                batches.append(len(rows))
+                return self._conn.executemany(sql, rows)
+
+            def __getattr__(self, name):
+                return getattr(self._conn, name)
+
+        db = connect(f"sqlite:///{db_path}")
+        db.register_type("/Test/*", VanillaOption)
+        db._backend._conn = CountingConnection(db._backend._conn)
+        with db:
+            for i in range(5):
+                db[f"/Test/{i}"] = VanillaOption()
+            option = VanillaOption()
+            option.Strike.set(120.0)
+            db["/Test/0"] = option
+
+        assert batches == [5]
+        with connect(f"sqlite:///{db_path}") as db:
+            db.register_type("/Test/*", VanillaOption)
+            assert db["/Test/0"].Strike() == 120.0
+            assert db._backend.get("/Test/0").version == 2
+
+    def test_error_after_nested_transaction_rolls_back_block(self, tmp_path):
+        """A raise after a nested transaction() undoes all of the block's writes."""
+        db_path = str(tmp_path / "test.db")
+
+        with pytest.raises(ValueError):
             with connect(f"sqlite:///{db_path}") as db:
-                db.register_type("/Instruments/*", VanillaOption)
-                loaded = db["/Instruments/AAPL_C_150"]
-                # Persisted fields preserved
-                assert loaded.Strike() == 150.0
-                assert loaded.IsCall() is False
-                # Non-Persisted field reverts to default
-                assert loaded.Spot() == 100.0  # Default, not 155.0
-        finally:
-            os.unlink(db_path)
+                db.register_type("/Test/*", VanillaOption)
+                db["/Test/Z"] = VanillaOption()
+                with db.transaction():
+                    db["/Test/Y"] = VanillaOption()
+                raise ValueError("Simulated error")
+
+        with connect(f"sqlite:///{db_path}") as db:
+            assert "/Test/Z" not in db
+            assert "/Test/Y" not in db
+
+    def test_nested_transaction_rollback_keeps_block_writes(self, tmp_path):
+        """A failed transaction() inside the block only undoes its own writes."""
+        db_path = str(tmp_path / "test.db")
+
+        with connect(f"sqlite:///{db_path}") as db:
+            db.register_type("/Test/*", VanillaOption)
+            db["/Test/Z"] = VanillaOption()
+            with pytest.raises(ValueError):
+                with db.transaction():
+                    db["/Test/Y"] = VanillaOption()
+                    raise ValueError("Simulated error")
+            db["/Test/X"] = VanillaOption()
+
+        with connect(f"sqlite:///{db_path}") as db:
+            assert "/Test/Z" in db
+            assert "/Test/Y" not in db
+            assert "/Test/X" in db
 
     def test_sqlite_memory(self):
         """SQLite in-memory mode works."""
@@ -518,15 +736,6 @@ class TestConnect:
 class TestObjectSelfAwareness:
     """Tests for object self-awareness (path, save, db)."""
 
-    @pytest.fixture
-    def memory_store(self):
-        """Create an in-memory store."""
-        store = connect("memory://")
-        store.register_type("/Instruments/*", VanillaOption)
-        store.register_type("/Stocks/*", Stock)
-        yield store
-        store.close()
-
     def test_object_knows_path_after_store(self, memory_store):
         """Object knows its path after being stored."""
         option = VanillaOption()
@@ -625,15 +834,6 @@ class TestObjectSelfAwareness:
 class TestStoreNew:
     """Tests for db.new() helper method."""
 
-    @pytest.fixture
-    def memory_store(self):
-        """Create an in-memory store."""
-        store = connect("memory://")
-        store.register_type("/Instruments/*", VanillaOption)
-        store.register_type("/Stocks/*", Stock)
-        yield store
-        store.close()
-
     def test_new_creates_and_stores(self, memory_store):
         """new() creates object and stores it."""
         option = memory_store.new(VanillaOption, "/Instruments/AAPL_C_150")
@@ -929,11 +1129,8 @@ class TestSchemaEvolution:
 class TestSchemaVersionInStore:
     """Tests for schema version handling in the Store."""
 
-    def test_schema_version_persisted_to_sqlite(self):
+    def test_schema_version_persisted_to_sqlite(self, tmp_path):
         """Schema version is persisted to SQLite."""
-        import tempfile
-        import os
-
         class TestModel(dag.Model):
             _schema_version_ = 5
 
@@ -941,25 +1138,21 @@ class TestSchemaVersionInStore:
             def Value(self) -> int:
                 return 0
 
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            db_path = f.name
+        db_path = str(tmp_path / "test.db")
 
-        try:
-            # Write with schema version
-            with connect(f"sqlite:///{db_path}") as db:
-                db.register_type("/Test/*", TestModel)
-                obj = TestModel()
-                obj.Value.set(42)
-                db["/Test/A"] = obj
-
-            # Read and check schema version was stored
-            backend = SQLiteBackend()
-            backend.connect(path=db_path)
-            stored = backend.get("/Test/A")
-            assert stored.schema_version == 5
-            backend.close()
-        finally:
-            os.unlink(db_path)
+        # Write with schema version
+        with connect(f"sqlite:///{db_path}") as db:
+            db.register_type("/Test/*", TestModel)
+            obj = TestModel()
+            obj.Value.set(42)
+            db["/Test/A"] = obj
+
+        # Read and check schema version was stored
+        backend = SQLiteBackend()
+        backend.connect(path=db_path)
+        stored = backend.get("/Test/A")
+        assert stored.schema_version == 5
+        backend.close()
 
     def test_store_roundtrip_with_migration(self):
         """Full roundtrip with schema migration works."""
@@ -170,6 +170,32 @@ class TestTradeBlotter:
         aapl_trades = blotter.by_symbol("AAPL_C_150")
         assert len(aapl_trades) == 2
 
+    def test_by_symbol_contents(self):
+        blotter = TradeBlotter()
+        blotter.record("AAPL_C_150", "BUY", 5, 5.25)
+        blotter.record("GOOGL_C_140", "SELL", 10, 8.00)
+        blotter.record("AAPL_C_150", "BUY", 5, 5.50)
+
+        prices = [t["price"] for t in blotter.by_symbol("AAPL_C_150")]
+        assert prices == pytest.approx([5.25, 5.50])
+        assert blotter.sells()[0]["symbol"] == "GOOGL_C_140"
+        assert len(blotter.by_symbol("UNKNOWN")) == 0
+
+    def test_views_are_snapshots(self):
+        blotter = TradeBlotter()
+        blotter.record("AAPL_C_150", "BUY", 5, 5.25)
+        blotter.record("AAPL_C_150", "SELL", 3, 5.50)
+
+        by_symbol = blotter.by_symbol("AAPL_C_150")
+        buys = blotter.buys()
+        sells = blotter.sells()
+        blotter.record("AAPL_C_150", "BUY", 2, 5.30)
+        blotter.record("AAPL_C_150", "SELL", 1, 5.60)
+
+        assert len(by_symbol) == 2
+        assert len(buys) == 1
+        assert len(sells) == 1
+
     def test_buys(self):
         blotter = TradeBlotter()
         blotter.record("AAPL_C_150", "BUY", 5, 5.25)
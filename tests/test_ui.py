@@ -11,6 +11,7 @@ from lattice.ui.protocol import (
     OverrideMessage,
     ConnectedMessage,
     ValueMessage,
+    ValueBatchMessage,
     ErrorMessage,
     parse_message,
 )
@@ -72,6 +73,18 @@ class TestProtocol:
         assert data["value"] == 10.5
         assert data["formatted"] == "$10.50"
 
+    def test_value_batch_message(self):
+        msg = ValueBatchMessage()
+        msg.add("option.Price", 10.5, "$10.50")
+        msg.add("option.Delta", 0.55)
+        data = json.loads(msg.to_json())
+        assert data["type"] == "values"
+        assert data["items"][0] == {"node_path": "option.Price", "value": 10.5, "formatted": "$10.50"}
+
+        restored = parse_message(msg.to_json())
+        assert isinstance(restored, ValueBatchMessage)
+        assert [item["node_path"] for item in restored.items] == ["option.Price", "option.Delta"]
+
     def test_error_message(self):
         msg = ErrorMessage(error="Node not found", node_path="option.Foo")
         json_str = msg.to_json()
@@ -80,6 +93,43 @@ class TestProtocol:
         assert data["error"] == "Node not found"
         assert data["node_path"] == "option.Foo"
 
+    def test_binary_round_trip(self):
+        pytest.importorskip("msgpack")
+        msg = SetMessage(node_path="option.Strike", value=110.0)
+        payload = msg.to_bytes()
+        assert isinstance(payload, bytes)
+        restored = parse_message(payload)
+        assert isinstance(restored, SetMessage)
+        assert restored.node_path == "option.Strike"
+        assert restored.value == 110.0
+
+    def test_binary_numpy_values(self):
+        pytest.importorskip("msgpack")
+        np = pytest.importorskip("numpy")
+        batch = ValueBatchMessage()
+        batch.add("option.Delta", np.float32(0.5))
+        batch.add("book.Count", np.int64(3))
+        batch.add("book.Flags", np.array([True, False]))
+        restored = parse_message(batch.to_bytes())
+        assert [item["value"] for item in restored.items] == [0.5, 3, [True, False]]
+
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_non_finite_values(self, monkeypatch, use_orjson):
+        import math
+        import lattice._json
+
+        if use_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(lattice._json, "HAS_ORJSON", use_orjson)
+
+        batch = ValueBatchMessage()
+        batch.add("option.Vega", float("nan"))
+        batch.add("option.Barrier", float("inf"))
+        restored = parse_message(batch.to_json())
+
+        assert math.isnan(restored.items[0]["value"])
+        assert restored.items[1]["value"] == float("inf")
+
 
 class TestBindings:
     """Tests for binding functions."""
@@ -261,6 +311,15 @@ class TestSessionManager:
         assert manager.session_count == 3
         assert len(manager.get_all_sessions()) == 3
 
+    def test_unreferenced_session_is_dropped(self):
+        import gc
+
+        manager = SessionManager()
+        session_id = manager.create_session().session_id
+        gc.collect()
+        assert manager.get_session(session_id) is None
+        assert manager.session_count == 0
+
 
 class TestDagApp:
     """Tests for DagApp."""
@@ -314,6 +373,18 @@ class TestDagApp:
         assert len(layout_dict["sections"]) == 1
         assert layout_dict["sections"][0]["name"] == "Results"
 
+    def test_layout_to_dict_reflects_edits(self):
+        app = DagApp("My App")
+        app.register(self.option, name="option")
+        app.add_section("Results", outputs=[bind(self.option.Price)])
+        app.layout.to_dict()
+
+        app.add_section("Inputs", inputs=[bind(self.option.Strike)])
+        app.layout.title = "Renamed"
+        layout = app.layout.to_dict()
+        assert layout["title"] == "Renamed"
+        assert [s["name"] for s in layout["sections"]] == ["Results", "Inputs"]
+
     def test_set_layout_from_dict(self):
         app = DagApp()
         app.register(self.option, name="option")
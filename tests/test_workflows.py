@@ -9,6 +9,10 @@ To run integration tests, install temporal extras:
     pip install lattice[temporal]
 """
 
+import asyncio
+import functools
+import importlib.util
+
 import pytest
 from dataclasses import asdict
 
@@ -24,7 +28,47 @@ from lattice.workflows.activities import (
     serialize_instrument,
     deserialize_instrument,
     _load_instrument,
+    _resolve_type,
 )
+from lattice.workflows.workflows import ComputeGreeksWorkflow, StressTestWorkflow
+
+_HAS_TEMPORAL = importlib.util.find_spec("temporalio") is not None
+
+
+@pytest.fixture(scope="session")
+def loop():
+    """Event loop shared by every async test in the module."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def temporal_env(loop):
+    """Temporal test environment, started once and shared by integration tests."""
+    from temporalio.testing import WorkflowEnvironment
+    from lattice.workflows import create_data_converter
+
+    env = loop.run_until_complete(
+        WorkflowEnvironment.start_local(data_converter=create_data_converter())
+    )
+    yield env
+    loop.run_until_complete(env.shutdown())
+
+
+@functools.lru_cache(maxsize=None)
+def _option_ref(**inputs) -> InstrumentRef:
+    """Ref for a VanillaOption with the given Input values, built once per inputs.
+
+    Shared between tests; treat the returned ref as read-only.
+    """
+    opt = VanillaOption()
+    for name, value in inputs.items():
+        getattr(opt, name).set(value)
+    return InstrumentRef(
+        serialized_state=serialize_instrument(opt),
+        type_name="lattice.VanillaOption",
+    )
 
 
 class TestInstrumentRef:
@@ -52,6 +96,14 @@ class TestInstrumentRef:
         d = asdict(ref)
         assert d["store_path"] == "/Instruments/AAPL_C_150"
 
+    def test_ref_to_dict_matches_asdict(self):
+        """Test InstrumentRef.to_dict() produces the same dict as asdict()."""
+        ref = InstrumentRef(
+            serialized_state={"Spot": 100.0},
+            type_name="lattice.VanillaOption",
+        )
+        assert ref.to_dict() == asdict(ref)
+
 
 class TestGreeksResult:
     """Tests for GreeksResult data class."""
@@ -154,6 +206,18 @@ class TestLoadInstrument:
         assert inst.Spot() == 100.0
         assert inst.Strike() == 100.0
 
+    def test_resolve_type_cached(self):
+        """Test type names are imported once and then served from cache."""
+        assert _resolve_type("lattice.VanillaOption") is VanillaOption
+        hits = _resolve_type.cache_info().hits
+        assert _resolve_type("lattice.VanillaOption") is VanillaOption
+        assert _resolve_type.cache_info().hits == hits + 1
+
+    def test_resolve_unqualified_type_raises(self):
+        """Test that a type name without a module raises ImportError."""
+        with pytest.raises(ImportError, match="Cannot import type"):
+            _resolve_type("VanillaOption")
+
     def test_load_invalid_ref_raises(self):
         """Test that invalid ref raises ValueError."""
         ref = InstrumentRef()
@@ -169,29 +233,61 @@ class TestLoadInstrument:
             _load_instrument(ref, store_uri=None)
 
 
+@pytest.mark.skipif(not _HAS_TEMPORAL, reason="temporalio not installed")
+class TestDataConverter:
+    """Tests for the Temporal data converter."""
+
+    def test_orjson_round_trip(self):
+        """Test instrument refs survive the orjson payload converter."""
+        pytest.importorskip("orjson")
+        from lattice.workflows.converter import create_data_converter
+
+        converter = create_data_converter().payload_converter
+        ref = InstrumentRef(
+            serialized_state={"Spot": 100.0, "Strike": 105.0},
+            type_name="lattice.VanillaOption",
+        )
+
+        payloads = converter.to_payloads([ref])
+        assert payloads[0].metadata["encoding"] == b"json/plain"
+
+        (restored,) = converter.from_payloads(payloads, [InstrumentRef])
+        assert restored == ref
+
+    def test_non_finite_round_trip(self):
+        """Test NaN and infinity survive instead of turning into None."""
+        import math
+
+        pytest.importorskip("orjson")
+        from lattice.workflows.converter import create_data_converter
+
+        converter = create_data_converter().payload_converter
+        result = GreeksResult(
+            instrument_name="OPT", delta=0.5, vega=float("inf"), theta=float("nan")
+        )
+
+        (restored,) = converter.from_payloads(
+            converter.to_payloads([result]), [GreeksResult]
+        )
+        assert restored.delta == 0.5
+        assert math.isnan(restored.theta)
+        assert restored.vega == float("inf")
+        assert restored.rho is None
+
+
+@pytest.mark.skipif(not _HAS_TEMPORAL, reason="temporalio not installed")
 class TestActivityLogic:
     """Tests for activity computation logic (without Temporal)."""
 
-    def test_compute_greeks_option(self):
+    def test_compute_greeks_option(self, loop):
         """Test computing Greeks for an option."""
-        import asyncio
-
-        pytest.importorskip("temporalio")
         from lattice.workflows.activities import compute_instrument_greeks
 
-        opt = VanillaOption()
-        opt.Spot.set(100.0)
-        opt.Strike.set(100.0)
-        opt.Volatility.set(0.20)
-        opt.Rate.set(0.05)
-        opt.TimeToExpiry.set(1.0)
-
-        ref = InstrumentRef(
-            serialized_state=serialize_instrument(opt),
-            type_name="lattice.VanillaOption",
+        ref = _option_ref(
+            Spot=100.0, Strike=100.0, Volatility=0.20, Rate=0.05, TimeToExpiry=1.0
         )
 
-        result = asyncio.run(
+        result = loop.run_until_complete(
             compute_instrument_greeks(
                 instrument_name="TEST_OPT",
                 instrument_ref=ref,
@@ -209,11 +305,8 @@ class TestActivityLogic:
         assert result.rho is not None
         assert result.error is None
 
-    def test_compute_greeks_bond(self):
+    def test_compute_greeks_bond(self, loop):
         """Test computing Greeks for a bond (only DV01)."""
-        import asyncio
-
-        pytest.importorskip("temporalio")
         from lattice.workflows.activities import compute_instrument_greeks
 
         bond = Bond()
@@ -226,7 +319,7 @@ class TestActivityLogic:
             type_name="lattice.Bond",
         )
 
-        result = asyncio.run(
+        result = loop.run_until_complete(
             compute_instrument_greeks(
                 instrument_name="TEST_BOND",
                 instrument_ref=ref,
@@ -240,24 +333,64 @@ class TestActivityLogic:
         assert result.dv01 is not None
         assert result.dv01 > 0
 
-    def test_compute_stress_test(self):
-        """Test stress testing an option."""
-        import asyncio
+    def test_compute_portfolio_greeks(self, loop):
+        """Test batched Greeks match per-instrument Greeks."""
+        from lattice.workflows.activities import (
+            compute_instrument_greeks,
+            compute_portfolio_greeks,
+        )
 
-        pytest.importorskip("temporalio")
-        from lattice.workflows.activities import compute_stress_test
+        refs = {}
+        for i, strike in enumerate([90.0, 100.0, 110.0]):
+            refs[f"OPT_{i}"] = _option_ref(Spot=100.0, Strike=strike)
+        refs["BAD"] = InstrumentRef()
 
-        opt = VanillaOption()
-        opt.Spot.set(100.0)
-        opt.Strike.set(100.0)
-        opt.Volatility.set(0.20)
+        results = loop.run_until_complete(compute_portfolio_greeks(refs, bump=0.01))
 
-        ref = InstrumentRef(
-            serialized_state=serialize_instrument(opt),
-            type_name="lattice.VanillaOption",
-        )
+        assert list(results) == ["OPT_0", "OPT_1", "OPT_2", "BAD"]
+        assert results["BAD"].error is not None
+        for name in ["OPT_0", "OPT_1", "OPT_2"]:
+            single = loop.run_until_complete(compute_instrument_greeks(name, refs[name], 0.01))
+            assert results[name] == single
+
+    def test_compute_portfolio_greeks_duplicates(self, loop, monkeypatch):
+        """Test identical refs in a batch are computed once, under their own names."""
+        from lattice.workflows import activities
+
+        calls = []
+        compute_greeks = activities._compute_greeks
+
+        def counting_compute_greeks(result, inst, bump):
+            calls.append(result.instrument_name)
+            return compute_greeks(result, inst, bump)
+
+        monkeypatch.setattr(activities, "_compute_greeks", counting_compute_greeks)
+
+        atm = _option_ref(Spot=100.0, Strike=100.0)
+        otm = _option_ref(Spot=100.0, Strike=120.0)
+        refs = {
+            "BOOK_A": atm,
+            "BOOK_B": InstrumentRef(
+                serialized_state=dict(atm.serialized_state), type_name=atm.type_name
+            ),
+            "BOOK_C": otm,
+        }
+
+        results = loop.run_until_complete(activities.compute_portfolio_greeks(refs))
+
+        assert calls == ["BOOK_A", "BOOK_C"]
+        assert results["BOOK_A"].instrument_name == "BOOK_A"
+        assert results["BOOK_B"].instrument_name == "BOOK_B"
+        assert results["BOOK_B"].delta == results["BOOK_A"].delta
+        assert results["BOOK_C"].delta != results["BOOK_A"].delta
+
+    def test_compute_stress_test(self, loop):
+        """Test stress testing an option."""
+        from lattice.workflows.activities import compute_stress_test
+
+        ref = _option_ref(Spot=100.0, Strike=100.0, Volatility=0.20)
 
-        result = asyncio.run(
+        result = loop.run_until_complete(
             compute_stress_test(
                 instrument_name="TEST_OPT",
                 instrument_ref=ref,
@@ -272,133 +405,110 @@ class TestActivityLogic:
         assert result["price_impact"] < 0
 
 
-def _has_temporalio():
-    """Check if temporalio is available."""
-    try:
-        import temporalio
-        return True
-    except ImportError:
-        return False
-
-
-@pytest.mark.skipif(not _has_temporalio(), reason="temporalio not installed")
+@pytest.mark.skipif(not _HAS_TEMPORAL, reason="temporalio not installed")
 class TestWorkflowIntegration:
     """Integration tests with Temporal testing environment.
 
     These tests use Temporal's built-in test environment which doesn't
-    require a real Temporal server.
+    require a real Temporal server. The environment is started once per
+    session (temporal_env) and one worker serves every test in the class.
+    That worker runs workflows unsandboxed to skip the sandbox's per-run
+    module reloading; test_sandboxed_worker covers the production runner.
     """
 
-    def test_compute_greeks_workflow(self):
-        """Test the full Greeks workflow with Temporal test environment."""
-        import asyncio
-        from temporalio.testing import WorkflowEnvironment
-        from temporalio.worker import Worker
-        from temporalio.worker.workflow_sandbox import (
-            SandboxedWorkflowRunner,
-            SandboxRestrictions,
-        )
-        from lattice.workflows import (
-            ComputeGreeksWorkflow,
-            StressTestWorkflow,
-            InstrumentRef,
-            compute_instrument_greeks,
-            compute_stress_test,
-        )
+    TASK_QUEUE = "test-queue"
 
-        opt = VanillaOption()
-        opt.Spot.set(100.0)
-        opt.Strike.set(100.0)
+    @pytest.fixture(scope="class")
+    def client(self, loop, temporal_env):
+        """Client for a worker running all Lattice workflows and activities."""
+        from temporalio.worker import UnsandboxedWorkflowRunner
+        from lattice.workflows import create_worker
 
-        instruments = {
-            "OPT_1": asdict(
-                InstrumentRef(
-                    serialized_state=serialize_instrument(opt),
-                    type_name="lattice.VanillaOption",
-                )
+        worker = loop.run_until_complete(
+            create_worker(
+                temporal_env.client,
+                task_queue=self.TASK_QUEUE,
+                workflow_runner=UnsandboxedWorkflowRunner(),
+            )
+        )
+        running = loop.create_task(worker.run())
+        yield temporal_env.client
+        loop.run_until_complete(worker.shutdown())
+        loop.run_until_complete(running)
+
+    @pytest.mark.parametrize(
+        "workflow_cls, args, check",
+        [
+            (
+                ComputeGreeksWorkflow,
+                [0.01, None],
+                lambda r: r["delta"] is not None,
             ),
-        }
+            (
+                StressTestWorkflow,
+                [{"Spot": -0.10}, None],
+                lambda r: r["price_impact"] < 0,
+            ),
+        ],
+        ids=["greeks", "stress"],
+    )
+    def test_instrument_workflow(self, loop, client, workflow_cls, args, check):
+        """Test the per-instrument workflows with Temporal test environment."""
+        instruments = {"OPT_1": _option_ref(Spot=100.0, Strike=100.0).to_dict()}
+
+        result = loop.run_until_complete(
+            client.execute_workflow(
+                workflow_cls.run,
+                args=[instruments, *args],
+                id=f"test-{workflow_cls.__name__}-1",
+                task_queue=self.TASK_QUEUE,
+            )
+        )
 
-        async def run_test():
-            async with await WorkflowEnvironment.start_local() as env:
-                worker = Worker(
-                    env.client,
-                    task_queue="test-queue",
-                    workflows=[ComputeGreeksWorkflow, StressTestWorkflow],
-                    activities=[compute_instrument_greeks, compute_stress_test],
-                    workflow_runner=SandboxedWorkflowRunner(
-                        restrictions=SandboxRestrictions.default.with_passthrough_modules(
-                            "numpy", "dag", "lattice"
-                        )
-                    ),
-                )
-                async with worker:
-                    result = await env.client.execute_workflow(
-                        ComputeGreeksWorkflow.run,
-                        args=[instruments, 0.01, None],
-                        id="test-greeks-1",
-                        task_queue="test-queue",
-                    )
-                    return result
+        assert "OPT_1" in result
+        assert check(result["OPT_1"])
 
-        result = asyncio.run(run_test())
+    def test_compute_portfolio_greeks_workflow(self, loop, client):
+        """Test the batched portfolio Greeks workflow with 32 instruments."""
+        from lattice.workflows import ComputePortfolioGreeksWorkflow
 
-        assert "OPT_1" in result
-        assert result["OPT_1"]["delta"] is not None
+        instruments = {
+            f"OPT_{i}": _option_ref(Spot=100.0, Strike=80.0 + i * 1.25).to_dict()
+            for i in range(32)
+        }
 
-    def test_stress_test_workflow(self):
-        """Test the full stress test workflow with Temporal test environment."""
-        import asyncio
-        from temporalio.testing import WorkflowEnvironment
-        from temporalio.worker import Worker
-        from temporalio.worker.workflow_sandbox import (
-            SandboxedWorkflowRunner,
-            SandboxRestrictions,
-        )
-        from lattice.workflows import (
-            ComputeGreeksWorkflow,
-            StressTestWorkflow,
-            InstrumentRef,
-            compute_instrument_greeks,
-            compute_stress_test,
+        result = loop.run_until_complete(
+            client.execute_workflow(
+                ComputePortfolioGreeksWorkflow.run,
+                args=[instruments, 0.01, None, 10],
+                id="test-portfolio-greeks-1",
+                task_queue=self.TASK_QUEUE,
+            )
         )
 
-        opt = VanillaOption()
-        opt.Spot.set(100.0)
-        opt.Strike.set(100.0)
+        assert set(result) == set(instruments)
+        assert all(r.get("error") is None for r in result.values())
+        # Delta falls as the strike rises
+        deltas = [result[f"OPT_{i}"]["delta"] for i in range(32)]
+        assert deltas == sorted(deltas, reverse=True)
 
-        instruments = {
-            "OPT_1": asdict(
-                InstrumentRef(
-                    serialized_state=serialize_instrument(opt),
-                    type_name="lattice.VanillaOption",
-                )
-            ),
-        }
+    @pytest.mark.sandbox
+    def test_sandboxed_worker(self, loop, temporal_env):
+        """Test a workflow under the default sandboxed runner."""
+        from lattice.workflows import ComputeGreeksWorkflow, create_worker
+
+        instruments = {"OPT_1": _option_ref(Spot=100.0, Strike=100.0).to_dict()}
 
         async def run_test():
-            async with await WorkflowEnvironment.start_local() as env:
-                worker = Worker(
-                    env.client,
-                    task_queue="test-queue",
-                    workflows=[ComputeGreeksWorkflow, StressTestWorkflow],
-                    activities=[compute_instrument_greeks, compute_stress_test],
-                    workflow_runner=SandboxedWorkflowRunner(
-                        restrictions=SandboxRestrictions.default.with_passthrough_modules(
-                            "numpy", "dag", "lattice"
-                        )
-                    ),
+            worker = await create_worker(temporal_env.client, task_queue="test-sandbox-queue")
+            async with worker:
+                return await temporal_env.client.execute_workflow(
+                    ComputeGreeksWorkflow.run,
+                    args=[instruments, 0.01, None],
+                    id="test-sandboxed-greeks-1",
+                    task_queue="test-sandbox-queue",
                 )
-                async with worker:
-                    result = await env.client.execute_workflow(
-                        StressTestWorkflow.run,
-                        args=[instruments, {"Spot": -0.10}, None],
-                        id="test-stress-1",
-                        task_queue="test-queue",
-                    )
-                    return result
 
-        result = asyncio.run(run_test())
+        result = loop.run_until_complete(run_test())
 
-        assert "OPT_1" in result
-        assert result["OPT_1"]["price_impact"] < 0
+        assert result["OPT_1"]["delta"] is not None